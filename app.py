@@ -9,6 +9,7 @@ from backend.config.app_config import setup_page
 from backend.logs.error_logger import setup_error_logging
 from backend.logs.logger_setup import setup_logger
 from frontend.components.ui_components import create_client_plant_filters, create_date_filters
+from backend.data.db_data_manager import prefetch_dashboard_data
 from src.display_components import (
     display_consumption_view,
     display_generation_consumption_view, 
@@ -86,6 +87,9 @@ def main():
         # Check if single day is selected
         is_single_day = start_date == end_date
 
+        # Load the independent datasets in parallel; the views below read them from cache
+        prefetch_dashboard_data(selected_client, selected_plant, start_date, end_date, include_combined=has_solar and has_wind)
+
         # Create tabs for Summary, ToD, Power Cost Analysis, and Validations
         summary_tab, tod_tab, cost_tab = st.tabs(["Summary", "ToD", "Power Cost Analysis"])
 
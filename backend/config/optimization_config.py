@@ -4,7 +4,9 @@ This module controls which optimizations are enabled.
 """
 
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Mapping
 
 # Optimization feature flags
 OPTIMIZATION_CONFIG = {
@@ -58,14 +60,35 @@ OPTIMIZATION_CONFIG = {
     }
 }
 
-def get_optimization_config() -> Dict[str, Any]:
+# Read-only view handed out by get_optimization_config; tracks later updates
+_CONFIG_VIEW = MappingProxyType(OPTIMIZATION_CONFIG)
+
+@dataclass(frozen=True, slots=True)
+class OptimizationFlags:
+    """Immutable snapshot of the boolean feature flags in OPTIMIZATION_CONFIG."""
+    enable_data_validation: bool = False
+    enable_smart_caching: bool = False
+    enable_availability_checks: bool = False
+    enable_query_optimization: bool = False
+    enable_smart_logging: bool = False
+    enable_request_validation: bool = False
+
+def _build_optimization_flags() -> OptimizationFlags:
+    """Build the flag snapshot from the current OPTIMIZATION_CONFIG."""
+    return OptimizationFlags(**{
+        field.name: bool(OPTIMIZATION_CONFIG.get(field.name, False))
+        for field in fields(OptimizationFlags)
+    })
+
+def get_optimization_config() -> Mapping[str, Any]:
     """
     Get the current optimization configuration.
+    Use update_optimization_config to change settings; the view cannot be mutated.
     
     Returns:
-        Dictionary with optimization settings
+        Read-only mapping with optimization settings
     """
-    return OPTIMIZATION_CONFIG.copy()
+    return _CONFIG_VIEW
 
 def is_optimization_enabled(feature: str) -> bool:
     """
@@ -77,56 +100,59 @@ def is_optimization_enabled(feature: str) -> bool:
     Returns:
         True if enabled, False otherwise
     """
-    return OPTIMIZATION_CONFIG.get(feature, False)
+    return getattr(OPTIMIZATION_FLAGS, feature, False)
 
-def get_cache_ttl(data_type: str) -> int:
+def get_cache_ttl(data_type: str, default: int = 1800) -> int:
     """
     Get cache TTL for a specific data type.
     
     Args:
         data_type: Type of data (plants, generation, consumption, etc.)
+        default: TTL used for data types without an explicit setting
         
     Returns:
         TTL in seconds
     """
-    return OPTIMIZATION_CONFIG.get('cache_ttl', {}).get(data_type, 1800)
+    return _CACHE_TTL.get(data_type, default)
 
-def get_retry_config() -> Dict[str, Any]:
+def get_retry_config() -> Mapping[str, Any]:
     """
     Get retry configuration.
     
     Returns:
-        Dictionary with retry settings
+        Read-only mapping with retry settings
     """
-    return OPTIMIZATION_CONFIG.get('retry_config', {'max_retries': 2, 'retry_delay': 0.5})
+    return _RETRY_CONFIG
 
-def get_validation_config() -> Dict[str, Any]:
+def get_validation_config() -> Mapping[str, Any]:
     """
     Get validation configuration.
     
     Returns:
-        Dictionary with validation settings
+        Read-only mapping with validation settings
     """
-    return OPTIMIZATION_CONFIG.get('validation_config', {})
+    return _VALIDATION_CONFIG
 
-def get_logging_config() -> Dict[str, Any]:
+def get_logging_config() -> Mapping[str, Any]:
     """
     Get logging configuration.
     
     Returns:
-        Dictionary with logging settings
+        Read-only mapping with logging settings
     """
-    return OPTIMIZATION_CONFIG.get('logging_config', {})
+    return _LOGGING_CONFIG
 
 def update_optimization_config(updates: Dict[str, Any]):
     """
     Update optimization configuration.
+    Intended for tests; rebuilds the OPTIMIZATION_FLAGS snapshot and the
+    read-only section views.
     
     Args:
         updates: Dictionary with configuration updates
     """
-    global OPTIMIZATION_CONFIG
     OPTIMIZATION_CONFIG.update(updates)
+    _resolve_config()
 
 # Environment-based configuration overrides
 def load_environment_config():
@@ -157,4 +183,18 @@ def load_environment_config():
         })
 
 # Load environment configuration on import
-load_environment_config()
\ No newline at end of file
+load_environment_config()
+
+def _resolve_config():
+    """Resolve the flag snapshot and read-only section views from OPTIMIZATION_CONFIG."""
+    global OPTIMIZATION_FLAGS, _CACHE_TTL, _RETRY_CONFIG, _VALIDATION_CONFIG, _LOGGING_CONFIG
+    OPTIMIZATION_FLAGS = _build_optimization_flags()
+    _CACHE_TTL = MappingProxyType(dict(OPTIMIZATION_CONFIG.get('cache_ttl', {})))
+    _RETRY_CONFIG = MappingProxyType(dict(OPTIMIZATION_CONFIG.get('retry_config', {'max_retries': 2, 'retry_delay': 0.5})))
+    _VALIDATION_CONFIG = MappingProxyType(dict(OPTIMIZATION_CONFIG.get('validation_config', {})))
+    _LOGGING_CONFIG = MappingProxyType(dict(OPTIMIZATION_CONFIG.get('logging_config', {})))
+
+# Feature flags and section views resolved once at import, after the
+# environment overrides; read as optimization_config.OPTIMIZATION_FLAGS.enable_smart_logging
+# (through the module, so update_optimization_config is still picked up)
+_resolve_config()
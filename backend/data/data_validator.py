@@ -3,87 +3,339 @@ Data validation utilities for the Energy Generation Dashboard.
 Provides centralized data availability checks and validation logic.
 """
 
-import pandas as pd
-from datetime import datetime, date, timedelta
-from typing import Optional, Dict, List, Tuple
-from sqlalchemy import and_, func
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Optional, Dict, List, Tuple
 
-from db.db_setup import SessionLocal
-from db.models import TblPlants, TblGeneration, TblConsumption, SettlementData
+# SQLAlchemy, the engine and the ORM models are imported inside the methods
+# that use them so importing this module does not pull in the database layer.
 from backend.logs.logger_setup import setup_logger
 
+try:
+    import redis
+except ImportError:  # Redis is optional; the validator cache stays process-local
+    redis = None
+
 # Configure logging
 logger = setup_logger('data_validator', 'data_validation.log')
 
+# Plant metadata and date ranges only change on ingest, so lookups are served
+# from a process-wide cache. Entries older than the fresh TTL are returned
+# stale while a background thread refreshes them; past the stale window the
+# caller waits for a fresh value.
+VALIDATOR_CACHE_FRESH_TTL = 1800  # 30 minutes
+VALIDATOR_CACHE_STALE_MULTIPLIER = 3  # served stale for up to 90 minutes
+VALIDATOR_CACHE_MAXSIZE = 4096
+
+# When VALIDATOR_REDIS_URL is set (and redis is installed) entries are kept in
+# Redis instead, so all worker processes share one cache and one invalidation.
+VALIDATOR_REDIS_URL = os.getenv('VALIDATOR_REDIS_URL')
+VALIDATOR_REDIS_PREFIX = 'val:'
+
+_validator_cache: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+_validator_cache_lock = threading.Lock()
+_refreshing_keys = set()
+_redis_client = None
+
+def _get_redis_client():
+    """Return the shared Redis client, or None when Redis is not configured."""
+    global _redis_client
+    if _redis_client is None and redis is not None and VALIDATOR_REDIS_URL:
+        _redis_client = redis.Redis.from_url(VALIDATOR_REDIS_URL)
+    return _redis_client
+
+def _redis_key(key: Tuple[str, str]) -> str:
+    """Build the Redis key for a validator cache key, e.g. val:date_range:P1."""
+    return f"{VALIDATOR_REDIS_PREFIX}{key[0]}:{key[1]}"
+
+def _encode_value(value: Any) -> Any:
+    """Make a validator value JSON-serialisable; date ranges are stored as ISO strings."""
+    if isinstance(value, tuple):
+        return [item.isoformat() if isinstance(item, date) else item for item in value]
+    return value
+
+def _decode_value(key: Tuple[str, str], value: Any) -> Any:
+    """Rebuild a validator value read back from JSON, the inverse of _encode_value."""
+    if key[0] == 'date_range':
+        min_date, max_date = value
+        return (
+            date.fromisoformat(min_date[:10]) if min_date else None,
+            date.fromisoformat(max_date[:10]) if max_date else None
+        )
+    return value
+
+def _load_cached_entry(key: Tuple[str, str]) -> Optional[Tuple[Any, float]]:
+    """
+    Look up a cached validator value.
+    
+    Returns:
+        Tuple of (value, age in seconds), or None on a miss
+    """
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            payload = client.get(_redis_key(key))
+        except Exception as e:
+            logger.error(f"Redis lookup failed for {key}: {e}")
+            return None
+        if payload is None:
+            return None
+        try:
+            entry = json.loads(payload)
+            value = _decode_value(key, entry['value'])
+            stored_at = float(entry['stored_at'])
+        except Exception as e:
+            # Unreadable entries (e.g. written by an older version) count as misses
+            logger.warning(f"Ignoring undecodable Redis entry for {key}: {e}")
+            return None
+        return value, time.time() - stored_at
+    
+    with _validator_cache_lock:
+        entry = _validator_cache.get(key)
+        if entry is None:
+            return None
+        _validator_cache.move_to_end(key)
+    value, fetched_at = entry
+    return value, time.monotonic() - fetched_at
+
+def _store_cached_value(key: Tuple[str, str], value: Any):
+    """Store a value in the validator cache, evicting the least recently used entry."""
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            client.set(
+                _redis_key(key),
+                json.dumps({'value': _encode_value(value), 'stored_at': time.time()}),
+                ex=int(VALIDATOR_CACHE_FRESH_TTL * VALIDATOR_CACHE_STALE_MULTIPLIER)
+            )
+        except Exception as e:
+            logger.error(f"Redis store failed for {key}: {e}")
+        return
+    
+    with _validator_cache_lock:
+        _validator_cache[key] = (value, time.monotonic())
+        _validator_cache.move_to_end(key)
+        while len(_validator_cache) > VALIDATOR_CACHE_MAXSIZE:
+            _validator_cache.popitem(last=False)
+
+def _refresh_cached_value(key: Tuple[str, str], fetch: Callable):
+    """Re-run a lookup with its own session and update the cache."""
+    try:
+        with DataAvailabilityChecker() as checker:
+            _store_cached_value(key, fetch(checker, key[1]))
+    except Exception as e:
+        logger.error(f"Background refresh failed for {key}: {e}")
+    finally:
+        with _validator_cache_lock:
+            _refreshing_keys.discard(key)
+
+def _cached_lookup(kind: str, plant_id: str, checker: "DataAvailabilityChecker", fetch: Callable) -> Any:
+    """
+    Serve a validator lookup from the cache with stale-while-revalidate semantics.
+    
+    Args:
+        kind: Lookup name, used as part of the cache key
+        plant_id: Plant identifier
+        checker: Checker whose session is used on a cache miss
+        fetch: Unbound checker method performing the uncached lookup
+    """
+    key = (kind, plant_id)
+    entry = _load_cached_entry(key)
+    
+    if entry is not None:
+        value, age = entry
+        if age < VALIDATOR_CACHE_FRESH_TTL:
+            return value
+        if age < VALIDATOR_CACHE_FRESH_TTL * VALIDATOR_CACHE_STALE_MULTIPLIER:
+            with _validator_cache_lock:
+                schedule = key not in _refreshing_keys
+                _refreshing_keys.add(key)
+            if schedule:
+                threading.Thread(target=_refresh_cached_value, args=(key, fetch), daemon=True).start()
+            return value
+    
+    value = fetch(checker, plant_id)
+    _store_cached_value(key, value)
+    return value
+
+@lru_cache(maxsize=256)
+def _parse_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string; repeated strings share the parsed object."""
+    return date.fromisoformat(date_str)
+
+_TODAY_TTL = 60  # seconds
+_today_value: Optional[date] = None
+_today_iso_value = ''
+_today_expires_at = 0.0
+
+def _today() -> date:
+    """Return today's date, re-read from the clock at most once per minute."""
+    global _today_value, _today_iso_value, _today_expires_at
+    now = time.monotonic()
+    if _today_value is None or now >= _today_expires_at:
+        _today_value = date.today()
+        _today_iso_value = _today_value.isoformat()
+        _today_expires_at = now + _TODAY_TTL
+    return _today_value
+
+def _today_iso() -> str:
+    """Return today's date as YYYY-MM-DD, refreshed together with _today()."""
+    _today()
+    return _today_iso_value
+
+def clear_validator_cache():
+    """Drop all cached validator lookups. Call after ingesting new data."""
+    with _validator_cache_lock:
+        _validator_cache.clear()
+    
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            keys = list(client.scan_iter(match=f"{VALIDATOR_REDIS_PREFIX}*"))
+            if keys:
+                client.delete(*keys)
+        except Exception as e:
+            logger.error(f"Failed to clear Redis validator cache: {e}")
+
+@lru_cache(maxsize=None)
+def _availability_statement():
+    """
+    Build the availability EXISTS probe once, with bound parameters.
+    
+    Reusing the same statement object keeps SQLAlchemy's compiled cache hot,
+    so each check only binds plant_id/start_date/end_date and executes.
+    
+    Returns:
+        Select with generation, settlement, consumption and plant_exists columns
+    """
+    from sqlalchemy import and_, bindparam, exists, select
+    from db.models import TblPlants, TblGeneration, TblConsumption, SettlementData
+    
+    plant_id = bindparam('plant_id')
+    start_date = bindparam('start_date')
+    end_date = bindparam('end_date')
+    
+    # Probe all tables with EXISTS in a single round-trip
+    client_name = select(TblPlants.client_name).where(
+        TblPlants.plant_id == plant_id
+    ).scalar_subquery()
+    
+    return select(
+        exists().where(and_(
+            TblGeneration.plant_id == plant_id,
+            TblGeneration.date >= start_date,
+            TblGeneration.date <= end_date
+        )).label('generation'),
+        exists().where(and_(
+            SettlementData.plant_id == plant_id,
+            SettlementData.date >= start_date,
+            SettlementData.date <= end_date
+        )).label('settlement'),
+        exists().where(and_(
+            TblConsumption.client_name == client_name,
+            TblConsumption.date >= start_date,
+            TblConsumption.date <= end_date
+        )).label('consumption'),
+        exists().where(TblPlants.plant_id == plant_id).label('plant_exists')
+    )
+
+
+# Session of the outermost open checker in the current context. Nested checkers
+# (e.g. the recommendation lookup inside a summary) reuse it instead of
+# checking out another connection; worker threads start with their own context.
+_active_session: ContextVar[Optional[Any]] = ContextVar('validator_session', default=None)
+
 class DataAvailabilityChecker:
     """Centralized data availability checker to prevent unnecessary warnings."""
     
     def __init__(self):
         self.session = None
+        self._owned = False
+        self._token = None
     
     def __enter__(self):
-        self.session = SessionLocal()
+        session = _active_session.get()
+        if session is not None:
+            self.session = session
+            self._owned = False
+        else:
+            from db.db_setup import ReadOnlySession
+            self.session = ReadOnlySession()
+            self._owned = True
+            self._token = _active_session.set(self.session)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owned:
+            _active_session.reset(self._token)
+            self._token = None
             self.session.close()
     
     def is_future_date(self, check_date: str) -> bool:
         """Check if the given date is in the future."""
-        try:
-            date_obj = datetime.strptime(check_date, '%Y-%m-%d').date()
-            today = datetime.now().date()
-            return date_obj > today
-        except Exception:
+        # YYYY-MM-DD strings order the same as the dates they encode
+        if not (isinstance(check_date, str) and len(check_date) == 10
+                and check_date[4] == check_date[7] == '-'):
             return False
+        return check_date > _today_iso()
     
     def get_available_date_range(self, plant_id: str) -> Tuple[Optional[date], Optional[date]]:
         """Get the available date range for a plant."""
         try:
-            # Check generation data
-            gen_range = self.session.query(
-                func.min(TblGeneration.date),
-                func.max(TblGeneration.date)
-            ).filter(TblGeneration.plant_id == plant_id).first()
-            
-            # Check settlement data
-            settle_range = self.session.query(
-                func.min(SettlementData.date),
-                func.max(SettlementData.date)
-            ).filter(SettlementData.plant_id == plant_id).first()
-            
-            # Use the most comprehensive range
-            min_date = None
-            max_date = None
-            
-            if gen_range and gen_range[0]:
-                min_date = gen_range[0]
-                max_date = gen_range[1]
-            
-            if settle_range and settle_range[0]:
-                if min_date is None or settle_range[0] < min_date:
-                    min_date = settle_range[0]
-                if max_date is None or settle_range[1] > max_date:
-                    max_date = settle_range[1]
-            
-            return min_date, max_date
-            
+            return _cached_lookup('date_range', plant_id, self, DataAvailabilityChecker._fetch_available_date_range)
         except Exception as e:
             logger.error(f"Failed to get date range for plant {plant_id}: {e}")
             return None, None
     
+    def _fetch_available_date_range(self, plant_id: str) -> Tuple[Optional[date], Optional[date]]:
+        """Query the available date range for a plant, bypassing the cache."""
+        from sqlalchemy import func, select, union_all
+        from db.models import TblGeneration, SettlementData
+        
+        # Per-table min/max combined in a single round-trip. Aggregating inside
+        # each branch (rather than a UNION of raw dates) keeps every branch an
+        # index seek on (plant_id, date) instead of a range scan.
+        ranges = union_all(
+            select(
+                func.min(TblGeneration.date).label('min_date'),
+                func.max(TblGeneration.date).label('max_date')
+            ).where(TblGeneration.plant_id == plant_id),
+            select(
+                func.min(SettlementData.date).label('min_date'),
+                func.max(SettlementData.date).label('max_date')
+            ).where(SettlementData.plant_id == plant_id)
+        ).subquery()
+        
+        min_date, max_date = self.session.execute(
+            select(func.min(ranges.c.min_date), func.max(ranges.c.max_date))
+        ).one()
+        
+        return min_date, max_date
+    
     def check_plant_exists(self, plant_id: str) -> bool:
         """Check if a plant exists in the database."""
         try:
-            exists = self.session.query(TblPlants).filter(
-                TblPlants.plant_id == plant_id
-            ).first() is not None
-            return exists
+            return _cached_lookup('plant_exists', plant_id, self, DataAvailabilityChecker._fetch_plant_exists)
         except Exception as e:
             logger.error(f"Failed to check plant existence for {plant_id}: {e}")
             return False
     
+    def _fetch_plant_exists(self, plant_id: str) -> bool:
+        """Query whether a plant exists, bypassing the cache."""
+        from sqlalchemy import select
+        from db.models import TblPlants
+        
+        return self.session.execute(
+            select(1).where(TblPlants.plant_id == plant_id).limit(1)
+        ).scalar() is not None
+    
     def check_data_availability(self, plant_id: str, start_date: str, end_date: str) -> Dict[str, bool]:
         """
         Check data availability for a plant and date range.
@@ -92,11 +344,12 @@ class DataAvailabilityChecker:
             Dict with availability status for different data types
         """
         try:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
+            start_dt = _parse_date(start_date)
+            end_dt = _parse_date(end_date)
             
-            # Check if dates are in the future
-            if self.is_future_date(start_date) or self.is_future_date(end_date):
+            # Future ranges cannot have data; answer before touching the database
+            today = _today()
+            if start_dt > today or end_dt > today:
                 logger.info(f"Requested dates {start_date} to {end_date} are in the future")
                 return {
                     'generation': False,
@@ -105,45 +358,17 @@ class DataAvailabilityChecker:
                     'future_date': True
                 }
             
-            # Check generation data
-            gen_count = self.session.query(TblGeneration).filter(
-                and_(
-                    TblGeneration.plant_id == plant_id,
-                    TblGeneration.date >= start_dt,
-                    TblGeneration.date <= end_dt
-                )
-            ).count()
-            
-            # Check settlement data
-            settle_count = self.session.query(SettlementData).filter(
-                and_(
-                    SettlementData.plant_id == plant_id,
-                    SettlementData.date >= start_dt,
-                    SettlementData.date <= end_dt
-                )
-            ).count()
-            
-            # Check consumption data (by client)
-            plant_info = self.session.query(TblPlants).filter(
-                TblPlants.plant_id == plant_id
-            ).first()
-            
-            cons_count = 0
-            if plant_info and plant_info.client_name:
-                cons_count = self.session.query(TblConsumption).filter(
-                    and_(
-                        TblConsumption.client_name == plant_info.client_name,
-                        TblConsumption.date >= start_dt,
-                        TblConsumption.date <= end_dt
-                    )
-                ).count()
+            result = self.session.execute(
+                _availability_statement(),
+                {'plant_id': plant_id, 'start_date': start_dt, 'end_date': end_dt}
+            ).one()
             
             return {
-                'generation': gen_count > 0,
-                'consumption': cons_count > 0,
-                'settlement': settle_count > 0,
+                'generation': bool(result.generation),
+                'consumption': bool(result.consumption),
+                'settlement': bool(result.settlement),
                 'future_date': False,
-                'plant_exists': plant_info is not None
+                'plant_exists': bool(result.plant_exists)
             }
             
         except Exception as e:
@@ -158,12 +383,19 @@ class DataAvailabilityChecker:
     
     def get_consumption_units_for_plant(self, plant_id: str) -> List[str]:
         """Get all consumption units associated with a plant."""
+        from sqlalchemy import select
+        from db.models import SettlementData
+        
         try:
-            units = self.session.query(SettlementData.cons_unit).filter(
-                SettlementData.plant_id == plant_id
-            ).distinct().all()
+            units = self.session.scalars(
+                select(SettlementData.cons_unit).where(
+                    SettlementData.plant_id == plant_id,
+                    SettlementData.cons_unit.isnot(None),
+                    SettlementData.cons_unit != ''
+                ).distinct()
+            ).all()
             
-            return [unit[0] for unit in units if unit[0]]
+            return list(units)
             
         except Exception as e:
             logger.error(f"Failed to get consumption units for plant {plant_id}: {e}")
@@ -177,14 +409,14 @@ def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
+        start_dt = _parse_date(start_date)
+        end_dt = _parse_date(end_date)
         
         if start_dt > end_dt:
             return False, "Start date cannot be after end date"
         
         # Check if dates are too far in the future
-        today = datetime.now().date()
+        today = _today()
         if start_dt > today + timedelta(days=1):
             return False, f"Start date {start_date} is too far in the future"
         
@@ -199,46 +431,76 @@ def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
     except Exception as e:
         return False, f"Date validation error: {e}"
 
-def get_recommended_date_range(plant_id: str) -> Tuple[Optional[str], Optional[str]]:
+def get_recommended_date_range(plant_id: str, checker: Optional[DataAvailabilityChecker] = None) -> Tuple[Optional[str], Optional[str]]:
     """
     Get recommended date range for a plant based on available data.
     
+    Args:
+        plant_id: Plant identifier
+        checker: Optional open checker whose session is reused instead of opening a new one
+    
     Returns:
         Tuple of (start_date, end_date) as strings, or (None, None) if no data
     """
     try:
-        with DataAvailabilityChecker() as checker:
-            min_date, max_date = checker.get_available_date_range(plant_id)
-            
-            if min_date and max_date:
-                # Recommend last 30 days of available data
-                recommended_start = max(min_date, max_date - timedelta(days=30))
-                return recommended_start.strftime('%Y-%m-%d'), max_date.strftime('%Y-%m-%d')
-            
-            return None, None
+        if checker is None:
+            with DataAvailabilityChecker() as checker:
+                return get_recommended_date_range(plant_id, checker)
+        
+        min_date, max_date = checker.get_available_date_range(plant_id)
+        
+        if min_date and max_date:
+            # Recommend last 30 days of available data
+            recommended_start = max(min_date, max_date - timedelta(days=30))
+            return recommended_start.strftime('%Y-%m-%d'), max_date.strftime('%Y-%m-%d')
+        
+        return None, None
             
     except Exception as e:
         logger.error(f"Failed to get recommended date range: {e}")
         return None, None
 
-def log_data_availability_summary(plant_id: str, start_date: str, end_date: str):
-    """Log a summary of data availability for debugging purposes."""
+def log_data_availability_summary(plant_id: str, start_date: str, end_date: str,
+                                  availability: Optional[Dict[str, bool]] = None,
+                                  checker: Optional[DataAvailabilityChecker] = None):
+    """
+    Log a summary of data availability for debugging purposes.
+    
+    Args:
+        plant_id: Plant identifier
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        availability: Result of an earlier check_data_availability call; re-queried if omitted
+        checker: Optional open checker whose session is reused instead of opening a new one
+    """
+    # Nothing below is worth a database round trip when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     try:
-        with DataAvailabilityChecker() as checker:
+        if checker is None and (availability is None or not (availability.get('generation') or availability.get('settlement'))):
+            with DataAvailabilityChecker() as checker:
+                return log_data_availability_summary(plant_id, start_date, end_date, availability, checker)
+        
+        if availability is None:
             availability = checker.check_data_availability(plant_id, start_date, end_date)
-            
-            logger.info(f"Data availability summary for plant {plant_id} ({start_date} to {end_date}):")
-            logger.info(f"  - Plant exists: {availability.get('plant_exists', False)}")
-            logger.info(f"  - Generation data: {availability.get('generation', False)}")
-            logger.info(f"  - Consumption data: {availability.get('consumption', False)}")
-            logger.info(f"  - Settlement data: {availability.get('settlement', False)}")
-            logger.info(f"  - Future date: {availability.get('future_date', False)}")
-            
-            if not any([availability.get('generation'), availability.get('settlement')]):
-                # Suggest alternative date range
-                rec_start, rec_end = get_recommended_date_range(plant_id)
-                if rec_start and rec_end:
-                    logger.info(f"  - Recommended date range: {rec_start} to {rec_end}")
+        
+        logger.info(
+            "Data availability summary for plant %s (%s to %s): exists=%s generation=%s "
+            "consumption=%s settlement=%s future=%s",
+            plant_id, start_date, end_date,
+            availability.get('plant_exists', False),
+            availability.get('generation', False),
+            availability.get('consumption', False),
+            availability.get('settlement', False),
+            availability.get('future_date', False)
+        )
+        
+        if not (availability.get('generation') or availability.get('settlement')):
+            # Suggest alternative date range
+            rec_start, rec_end = get_recommended_date_range(plant_id, checker)
+            if rec_start and rec_end:
+                logger.info("  - Recommended date range: %s to %s", rec_start, rec_end)
             
     except Exception as e:
-        logger.error(f"Failed to log data availability summary: {e}")
\ No newline at end of file
+        logger.error(f"Failed to log data availability summary: {e}")
@@ -3,27 +3,134 @@ Database-based data fetching functions for the Energy Generation Dashboard.
 All data is stored in 15-minute intervals in the database.
 """
 
+import os
+import importlib.util
+import hashlib
+import tempfile
+import random
+import time as time_module
+import numpy as np
 import pandas as pd
 import streamlit as st
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
 from typing import Optional, Dict, List
 import traceback
-from functools import wraps
+from functools import wraps, lru_cache
+from contextlib import contextmanager
 
-from sqlalchemy import and_, func, String, case, or_
+from sqlalchemy import and_, func, Date, DateTime, Float, text, bindparam
+from sqlalchemy.exc import OperationalError, InterfaceError, ProgrammingError
 
 from db.db_setup import SessionLocal
-from db.models import TblPlants, TblGeneration, TblConsumption, ConsumptionMapping, SettlementData, BankingSettlement
+from db.models import TblPlants, TblGeneration, TblConsumption, ConsumptionMapping, SettlementData
 from backend.logs.logger_setup import setup_logger
 from backend.config.tod_config import get_tod_slots
 
+# pyarrow is optional; without it the disk cache is skipped
+_PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
 # Configure logging
 logger = setup_logger('db_data', 'db_data.log')
 
+# On-disk cache shared across app restarts; entries expire with the in-memory cache TTL
+DISK_CACHE_DIR = os.getenv('DB_DATA_DISK_CACHE_DIR', os.path.join('.cache', 'db_data'))
+DISK_CACHE_TTL = 3600
+# Cache directory -> time of its last sweep for expired files
+_disk_cache_swept_at: Dict[str, float] = {}
+
+# Rows fetched per round-trip when streaming large interval results
+READ_BATCH_SIZE = 10000
+
+# Plain SQL for the small metadata lookups, bypassing ORM query building and row objects.
+# Both resolve any number of plants in one IN (...) round-trip. Names are resolved against
+# tbl_plants (one row per plant), never the interval tables; the consumption unit lookup
+# groups over ix_settle_plant_unit, an index-only scan
+_PLANT_IDS_BY_NAMES_SQL = text(
+    "SELECT plant_name, MIN(plant_id) FROM tbl_plants WHERE plant_name IN :plant_names GROUP BY plant_name"
+).bindparams(bindparam('plant_names', expanding=True))
+_CONS_UNITS_BY_PLANTS_SQL = text(
+    "SELECT plant_id, cons_unit FROM settlement_data WHERE plant_id IN :plant_ids "
+    "AND cons_unit IS NOT NULL AND cons_unit <> '' GROUP BY plant_id, cons_unit"
+).bindparams(bindparam('plant_ids', expanding=True))
+
+# Columns returned by the raw settlement fetches, with the numeric and low-cardinality label subsets
+_SETTLEMENT_COLUMNS = ['datetime', 'cons_unit', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled', 'slot_name', 'slot_time']
+_NUMERIC_SETTLEMENT_COLS = ['allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled']
+_CATEGORY_SETTLEMENT_COLS = ['cons_unit', 'slot_name', 'slot_time']
+# Columns of the shared per-interval frame behind the settlement summary views
+_SETTLEMENT_WIDE_COLUMNS = ['plant_id', 'type', 'datetime', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand']
+# Per-month, per-slot sums shared by the monthly banking views
+_BANKING_AGGREGATE_COLUMNS = [
+    'month', 'slot_name', 'slot_time', 'total_generation', 'total_consumption', 'settled_units_with_banking',
+    'intra_settlement', 'inter_settlement', 'surplus_generation_after_banking', 'surplus_demand_after_banking'
+]
+_NUMERIC_BANKING_COLS = _BANKING_AGGREGATE_COLUMNS[3:]
+
+# Fixed-shape aggregate queries declared once, so each call skips ORM query building
+# and statement cache lookups. COALESCE and the Float result type hand pandas NULL-free
+# floats instead of DECIMAL objects
+_DAILY_GENERATION_ROLLUP_SQL = text(
+    "SELECT date, COALESCE(generation, 0) AS generation FROM tbl_generation_daily "
+    "WHERE plant_id = :plant_id AND date >= :start_date AND date <= :end_date AND date < :today"
+).columns(date=Date, generation=Float)
+_DAILY_GENERATION_LIVE_SQL = text(
+    "SELECT date, COALESCE(SUM(generation), 0) AS generation FROM tbl_generation "
+    "WHERE plant_id = :plant_id AND date >= :start_date AND date <= :end_date AND date NOT IN :rollup_dates "
+    "GROUP BY date"
+).bindparams(bindparam('rollup_dates', expanding=True)).columns(date=Date, generation=Float)
+_DAILY_CONSUMPTION_SQL = text(
+    "SELECT date, COALESCE(SUM(consumption), 0) AS consumption FROM tbl_consumption "
+    "WHERE cons_unit = :cons_unit AND date >= :start_date AND date <= :end_date "
+    "GROUP BY date ORDER BY date"
+).columns(date=Date, consumption=Float)
+_UNITS_CONSUMPTION_SQL = text(
+    "SELECT datetime, COALESCE(SUM(consumption), 0) AS consumption FROM tbl_consumption "
+    "WHERE cons_unit IN :cons_units AND date >= :start_date AND date <= :end_date "
+    "GROUP BY datetime ORDER BY datetime"
+).bindparams(bindparam('cons_units', expanding=True)).columns(datetime=DateTime, consumption=Float)
+_DAILY_UNITS_CONSUMPTION_SQL = text(
+    "SELECT date, COALESCE(SUM(consumption), 0) AS consumption FROM tbl_consumption "
+    "WHERE cons_unit IN :cons_units AND date >= :start_date AND date <= :end_date "
+    "GROUP BY date ORDER BY date"
+).bindparams(bindparam('cons_units', expanding=True)).columns(date=Date, consumption=Float)
+_COMBINED_GENERATION_SQL = text(
+    "SELECT datetime, COALESCE(SUM(generation), 0) AS generation FROM tbl_generation "
+    "WHERE client_name = :client_name AND type = :plant_type AND date >= :start_date AND date <= :end_date "
+    "GROUP BY datetime ORDER BY datetime"
+).columns(datetime=DateTime, generation=Float)
+
+# Banking aggregates, one statement per combination of the optional plant and client filters
+_BANKING_AGGREGATES_SELECT = (
+    "SELECT date AS month, slot_name, slot_time, "
+    "SUM(COALESCE(surplus_generation_sum, 0)) AS total_generation, "
+    "SUM(COALESCE(surplus_demand_sum, 0)) AS total_consumption, "
+    "SUM(COALESCE(matched_settled_sum, 0)) AS settled_units_with_banking, "
+    "SUM(COALESCE(intra_settlement, 0)) AS intra_settlement, "
+    "SUM(COALESCE(inter_settlement, 0)) AS inter_settlement, "
+    "SUM(COALESCE(surplus_generation_sum_after_inter, 0)) AS surplus_generation_after_banking, "
+    "SUM(COALESCE(surplus_demand_sum_after_inter, 0)) AS surplus_demand_after_banking "
+    "FROM banking_settlement {where}"
+    "GROUP BY date, slot_name, slot_time ORDER BY date, slot_name"
+)
+# Keyed by (filter on plant_name, filter on client_name)
+_BANKING_AGGREGATES_SQL = {
+    (False, False): text(_BANKING_AGGREGATES_SELECT.format(where="")),
+    (True, False): text(_BANKING_AGGREGATES_SELECT.format(where="WHERE plant_name = :plant_name ")),
+    (False, True): text(_BANKING_AGGREGATES_SELECT.format(where="WHERE client_name = :client_name ")),
+    (True, True): text(_BANKING_AGGREGATES_SELECT.format(where="WHERE plant_name = :plant_name AND client_name = :client_name "))
+}
 
 
-def retry_on_exception(max_retries=3, retry_delay=1):
-    """Decorator to retry a function on exception"""
+
+def retry_on_exception(max_retries=3, retry_delay=1, max_delay=8):
+    """
+    Decorator to retry a function on transient database errors.
+    
+    Only connection-level failures (OperationalError, InterfaceError) are retried,
+    with exponential backoff and jitter; any other exception is raised immediately.
+    Decorated loaders re-raise these errors instead of returning an empty frame, so
+    they reach the retry and a failed fetch is never cached.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -31,22 +138,286 @@ def retry_on_exception(max_retries=3, retry_delay=1):
             for attempt in range(max_retries):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except (OperationalError, InterfaceError) as e:
+                    # Already retried by a nested decorated loader; don't multiply the attempts
+                    if getattr(e, 'retries_exhausted', False):
+                        raise
                     last_exception = e
                     logger.warning(f"Attempt {attempt+1}/{max_retries} failed: {e}")
                     if attempt < max_retries - 1:
-                        import time
-                        time.sleep(retry_delay)
+                        delay = min(max_delay, retry_delay * 2 ** attempt)
+                        time_module.sleep(delay + random.uniform(0, delay / 2))
             logger.error(f"Function {func.__name__} failed after {max_retries} attempts")
+            last_exception.retries_exhausted = True
             raise last_exception
         return wrapper
     return decorator
 
-def get_db_session():
-    """Get database session"""
-    return SessionLocal()
+def cached_df(func):
+    """
+    Cache a DataFrame-returning function in memory without pickling.
+    
+    st.cache_data serializes the cached DataFrame on every hit; st.cache_resource
+    returns the stored object itself, so each caller gets a cheap copy instead.
+    Functions returning a dict of DataFrames get a copy of each frame.
+    """
+    cached = st.cache_resource(ttl=3600)(func)
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = cached(*args, **kwargs)
+        if isinstance(result, dict):
+            return {key: frame.copy() for key, frame in result.items()}
+        return result.copy()
+    
+    wrapper.clear = cached.clear
+    return wrapper
+
+def _sweep_disk_cache(cache_dir: str, ttl: int):
+    """Delete cache files older than ttl seconds, at most once per ttl per directory"""
+    now = time_module.time()
+    if now - _disk_cache_swept_at.get(cache_dir, 0) < ttl:
+        return
+    _disk_cache_swept_at[cache_dir] = now
+    
+    for entry in os.scandir(cache_dir):
+        try:
+            if entry.is_file() and now - entry.stat().st_mtime > ttl:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            pass
 
-@st.cache_data(ttl=3600)
+def disk_cache(cache_dir: str = DISK_CACHE_DIR, ttl: int = DISK_CACHE_TTL):
+    """
+    Decorator persisting a DataFrame result on disk as zstd Parquet, keyed by a hash of its arguments.
+    
+    Without pyarrow the function is returned undecorated. Only non-empty DataFrames are
+    written, so a failed fetch is not served from disk on the next start. An expired
+    entry is deleted when it is hit, and files older than ttl are swept on writes.
+    
+    Args:
+        cache_dir: Directory holding the cache files
+        ttl: Maximum age of a cache file in seconds
+    """
+    def decorator(func):
+        if not _PARQUET_AVAILABLE:
+            return func
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = hashlib.sha1(repr((func.__module__, func.__qualname__, args, sorted(kwargs.items()))).encode()).hexdigest()
+            path = os.path.join(cache_dir, f"{key}.parquet")
+            
+            try:
+                if time_module.time() - os.path.getmtime(path) > ttl:
+                    os.remove(path)
+                else:
+                    return pd.read_parquet(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable disk cache entry {path}: {e}")
+            
+            result = func(*args, **kwargs)
+            
+            if not isinstance(result, pd.DataFrame) or result.empty:
+                return result
+            
+            tmp_path = None
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                # Unique temp file per writer: Streamlit sessions are threads of one
+                # process, so concurrent misses on one key must not share a temp name
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.", suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    result.to_parquet(f, compression='zstd')
+                # Atomic rename of a fully written file, so readers never see a partial entry
+                os.replace(tmp_path, path)
+                _sweep_disk_cache(cache_dir, ttl)
+            except Exception as e:
+                logger.warning(f"Failed to write disk cache entry for {func.__name__}: {e}")
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            return result
+        return wrapper
+    return decorator
+
+@contextmanager
+def db_session():
+    """Yield a pooled database session that is always returned to the pool"""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@lru_cache(maxsize=1)
+def _get_hour_to_tod_bin() -> Dict[int, str]:
+    """
+    Map each hour of the day to its ToD bin name, built once from the ToD configuration.
+    
+    Returns:
+        Dictionary of hour (0-23) to ToD bin name ('Unknown' if no slot covers it)
+    """
+    tod_slots = get_tod_slots()
+    hour_to_bin = {}
+    for hour in range(24):
+        hour_to_bin[hour] = 'Unknown'
+        for slot_name, slot_info in tod_slots.items():
+            start_hour = slot_info['start_hour']
+            end_hour = slot_info['end_hour']
+            
+            if start_hour <= end_hour:
+                if start_hour <= hour < end_hour:
+                    hour_to_bin[hour] = slot_name
+                    break
+            else:  # Crosses midnight
+                if hour >= start_hour or hour < end_hour:
+                    hour_to_bin[hour] = slot_name
+                    break
+    return hour_to_bin
+
+@lru_cache(maxsize=1)
+def _get_tod_bin_codes():
+    """
+    Categorical codes of each hour's ToD bin, built once from the ToD configuration.
+    
+    Returns:
+        Tuple of (length-24 int8 array of codes indexed by hour, sorted bin names)
+    """
+    hour_to_bin = _get_hour_to_tod_bin()
+    # Sorted categories keep groupby output in the same (alphabetical) order as plain strings
+    categories = sorted(set(hour_to_bin.values()))
+    codes = np.array([categories.index(hour_to_bin[hour]) for hour in range(24)], dtype=np.int8)
+    return codes, categories
+
+def _tod_bins(datetimes: pd.Series) -> pd.Categorical:
+    """ToD bin of each timestamp as a Categorical, via one fancy-index into the hour codes"""
+    codes, categories = _get_tod_bin_codes()
+    return pd.Categorical.from_codes(codes[datetimes.dt.hour.to_numpy()], categories=categories)
+
+def _datetime_bounds(start_dt: date, end_dt: date):
+    """Half-open [start, end + 1 day) datetime bounds covering whole days"""
+    return datetime.combine(start_dt, time.min), datetime.combine(end_dt + timedelta(days=1), time.min)
+
+def _read_frame(session, query, columns: List[str], numeric_columns: Optional[List[str]] = None,
+                date_columns: Optional[List[str]] = None, stream: bool = False,
+                float_columns: Optional[List[str]] = None, params: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Read a query into a DataFrame directly from the DBAPI cursor.
+    
+    Args:
+        session: Open database session
+        query: ORM query whose statement is executed, or a module-level text() statement
+        columns: Column names for the resulting DataFrame, in select order
+        numeric_columns: Columns returned as float64 with NULLs filled as 0
+        date_columns: Columns parsed as datetime64
+        stream: Fetch through a server-side cursor in READ_BATCH_SIZE batches, so the
+            driver never buffers the whole result set next to the DataFrame
+        float_columns: Columns already numeric and NULL-free in SQL (COALESCE typed as Float),
+            only cast to float64
+        params: Bind parameters for a text() statement
+        
+    Returns:
+        DataFrame with the given columns (empty if the query returned no rows)
+    """
+    statement = getattr(query, 'statement', query)
+    if stream:
+        connection = session.connection(execution_options={'stream_results': True, 'max_row_buffer': READ_BATCH_SIZE})
+        chunks = list(pd.read_sql(statement, connection, params=params, parse_dates=date_columns, chunksize=READ_BATCH_SIZE))
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+    else:
+        df = pd.read_sql(statement, session.connection(), params=params, parse_dates=date_columns)
+    df.columns = columns
+    
+    if numeric_columns:
+        # One vectorized cast for all numeric columns; stray non-numeric values become 0
+        df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce').fillna(0).astype('float64')
+    
+    if float_columns:
+        df[float_columns] = df[float_columns].astype('float64')
+    
+    return df
+
+def _compact(df: pd.DataFrame, numeric_columns: List[str], category_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Narrow dtypes of a raw interval DataFrame before it is cached.
+    
+    Per-interval readings fit comfortably in float32 and repeated labels in
+    categoricals, roughly halving the memory every downstream scan touches.
+    Aggregated totals are left as float64 to keep their precision.
+    
+    Args:
+        df: DataFrame to compact in place
+        numeric_columns: Columns converted to float32
+        category_columns: Label columns converted to category
+        
+    Returns:
+        The same DataFrame
+    """
+    df[numeric_columns] = df[numeric_columns].astype('float32')
+    if category_columns:
+        df[category_columns] = df[category_columns].astype('category')
+    return df
+
+def _empty_frame(**dtypes) -> pd.DataFrame:
+    """Zero-row DataFrame with the given column dtypes, in keyword order"""
+    return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()})
+
+# Typed no-data results of the loaders, matching the dtypes of their non-empty results,
+# so callers' .dt accessors and arithmetic behave the same on an empty range.
+# Loaders hand out copies, never the templates themselves
+_EMPTY_GENERATION = _empty_frame(datetime='datetime64[ns]', generation='float32')
+_EMPTY_CONSUMPTION = _empty_frame(datetime='datetime64[ns]', consumption='float32')
+_EMPTY_DAILY_GENERATION = _empty_frame(date='datetime64[ns]', generation='float64')
+_EMPTY_DAILY_CONSUMPTION = _empty_frame(date='datetime64[ns]', consumption='float64')
+_EMPTY_UNITS_CONSUMPTION = _empty_frame(datetime='datetime64[ns]', consumption='float64')
+_EMPTY_COMBINED_GENERATION = _empty_frame(datetime='datetime64[ns]', generation='float64')
+# Settlement intervals as cached by get_settlement_data_db: float32 readings, categorical labels
+_SETTLEMENT_DTYPES = {
+    col: 'datetime64[ns]' if col == 'datetime' else 'float32' if col in _NUMERIC_SETTLEMENT_COLS else 'category'
+    for col in _SETTLEMENT_COLUMNS
+}
+_EMPTY_SETTLEMENT = _empty_frame(**_SETTLEMENT_DTYPES)
+_EMPTY_SETTLEMENT_WIDE = _empty_frame(
+    plant_id='object', type='object', datetime='datetime64[ns]', allocated_generation='float64',
+    consumption='float64', deficit='float64', surplus_demand='float64'
+)
+_EMPTY_SETTLEMENT_SUMS = _empty_frame(
+    plant_id='object', type='object', datetime='datetime64[ns]', total_generation='float64', total_consumption='float64'
+)
+_EMPTY_COMBINED_CLIENT = _empty_frame(
+    client_name='category', type='category', datetime='datetime64[ns]', total_generation='float64'
+)
+_EMPTY_SETTLEMENT_TOD = _empty_frame(
+    plant_id='object', type='object', tod_bin='object',
+    allocated_generation_total='float64', consumption_total='float64', deficit_total='float64',
+    surplus_demand_total='float64', interval_count='int64', surplus_total='float64',
+    generation_normalized='float64', consumption_normalized='float64', surplus_normalized='float64',
+    deficit_normalized='float64', surplus_demand_normalized='float64', date='object'
+)
+# ToD rollups of get_tod_aggregated_data_db: float32 sums of the float32 settlement readings,
+# float64 normalized and total columns; the daily breakdown adds a date key
+_TOD_ENERGY_COLS = ['allocated_generation', 'consumption', 'surplus', 'surplus_demand', 'deficit']
+_TOD_DTYPES = {
+    'tod_bin': 'object',
+    **{col: 'float32' for col in _TOD_ENERGY_COLS},
+    'interval_count': 'int64',
+    **{f'{col}_normalized': 'float64' for col in _TOD_ENERGY_COLS},
+    **{f'{col}_total': 'float64' for col in _TOD_ENERGY_COLS}
+}
+_EMPTY_TOD_TOTAL = _empty_frame(**_TOD_DTYPES)
+_EMPTY_TOD_DAILY = _empty_frame(date='datetime64[ns]', **_TOD_DTYPES)
+_EMPTY_BANKING_AGGREGATES = _empty_frame(
+    month='object', slot_name='object', slot_time='object', **{col: 'float64' for col in _NUMERIC_BANKING_COLS}
+)
+_EMPTY_BANKING_METRICS = _empty_frame(
+    month='object', settled_without_banking='float64', settled_with_banking='float64',
+    grid_consumption_with_banking='float64', grid_consumption_without_banking='float64',
+    banking_savings='float64', grid_reduction='float64', total_savings='float64'
+)
+
+@cached_df
 @retry_on_exception()
 def get_generation_data_db(plant_id: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -61,45 +432,43 @@ def get_generation_data_db(plant_id: str, start_date: str, end_date: str) -> pd.
         DataFrame with columns: datetime, generation
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Query generation data
-        query = session.query(
-            TblGeneration.datetime,
-            TblGeneration.generation
-        ).filter(
-            and_(
-                TblGeneration.plant_id == plant_id,
-                TblGeneration.date >= start_dt,
-                TblGeneration.date <= end_dt
+        with db_session() as session:
+            # Query generation data
+            query = session.query(
+                TblGeneration.datetime,
+                TblGeneration.generation
+            ).filter(
+                and_(
+                    TblGeneration.plant_id == plant_id,
+                    TblGeneration.date >= start_dt,
+                    TblGeneration.date <= end_dt
+                )
             )
-        ).order_by(TblGeneration.datetime)
         
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
+            # Read rows straight into typed columns; no index returns them in datetime
+            # order, so sort the mostly-ordered frame here instead of a server filesort
+            df = _read_frame(session, query, ['datetime', 'generation'], numeric_columns=['generation'], date_columns=['datetime'], stream=True)
+            df = _compact(df, ['generation']).sort_values('datetime', kind='stable', ignore_index=True)
         
-        if not result:
+        if df.empty:
             logger.warning(f"No generation data found for plant {plant_id} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['datetime', 'generation'])
-        
-        df = pd.DataFrame(result, columns=['datetime', 'generation'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        df['generation'] = pd.to_numeric(df['generation'], errors='coerce').fillna(0)
+            return _EMPTY_GENERATION.copy()
         
         logger.info(f"Retrieved {len(df)} generation records for plant {plant_id}")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get generation data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['datetime', 'generation'])
+        return _EMPTY_GENERATION.copy()
 
-@st.cache_data(ttl=3600)
+@cached_df
 @retry_on_exception()
 def get_consumption_data_by_client(client_name: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -115,47 +484,44 @@ def get_consumption_data_by_client(client_name: str, start_date: str, end_date:
         DataFrame with columns: datetime, consumption
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Query consumption data using only client_name, datetime, consumption
-        query = session.query(
-            TblConsumption.datetime,
-            TblConsumption.consumption
-        ).filter(
-            and_(
-                TblConsumption.client_name == client_name,
-                TblConsumption.date >= start_dt,
-                TblConsumption.date <= end_dt
-            )
-        ).order_by(TblConsumption.datetime)
+        with db_session() as session:
+            # Query consumption data using only client_name, datetime, consumption
+            query = session.query(
+                TblConsumption.datetime,
+                TblConsumption.consumption
+            ).filter(
+                and_(
+                    TblConsumption.client_name == client_name,
+                    TblConsumption.date >= start_dt,
+                    TblConsumption.date <= end_dt
+                )
+            ).order_by(TblConsumption.datetime)
         
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
+            # Read rows straight into typed columns
+            df = _read_frame(session, query, ['datetime', 'consumption'], numeric_columns=['consumption'], date_columns=['datetime'])
+            df = _compact(df, ['consumption'])
         
-        if not result:
+        if df.empty:
             logger.warning(f"No consumption data found for client {client_name} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['datetime', 'consumption'])
-        
-        df = pd.DataFrame(result, columns=['datetime', 'consumption'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        df['consumption'] = pd.to_numeric(df['consumption'], errors='coerce').fillna(0)
+            return _EMPTY_CONSUMPTION.copy()
         
         logger.info(f"Retrieved {len(df)} consumption records for client {client_name}")
         
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get consumption data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['datetime', 'consumption'])
+        return _EMPTY_CONSUMPTION.copy()
 
 # Keep the old function for backward compatibility but mark as deprecated
-@st.cache_data(ttl=3600)
+@cached_df
 @retry_on_exception()
 def get_consumption_data_db(cons_unit: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -171,327 +537,331 @@ def get_consumption_data_db(cons_unit: str, start_date: str, end_date: str) -> p
         DataFrame with columns: datetime, consumption
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Query consumption data
-        query = session.query(
-            TblConsumption.datetime,
-            TblConsumption.consumption
-        ).filter(
-            and_(
-                TblConsumption.cons_unit == cons_unit,
-                TblConsumption.date >= start_dt,
-                TblConsumption.date <= end_dt
-            )
-        ).order_by(TblConsumption.datetime)
+        with db_session() as session:
+            # Query consumption data
+            query = session.query(
+                TblConsumption.datetime,
+                TblConsumption.consumption
+            ).filter(
+                and_(
+                    TblConsumption.cons_unit == cons_unit,
+                    TblConsumption.date >= start_dt,
+                    TblConsumption.date <= end_dt
+                )
+            ).order_by(TblConsumption.datetime)
         
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
+            # Read rows straight into typed columns
+            df = _read_frame(session, query, ['datetime', 'consumption'], numeric_columns=['consumption'], date_columns=['datetime'])
+            df = _compact(df, ['consumption'])
         
-        if not result:
+        if df.empty:
             logger.warning(f"No consumption data found for unit {cons_unit} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['datetime', 'consumption'])
-        
-        df = pd.DataFrame(result, columns=['datetime', 'consumption'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        df['consumption'] = pd.to_numeric(df['consumption'], errors='coerce').fillna(0)
+            return _EMPTY_CONSUMPTION.copy()
         
         logger.info(f"Retrieved {len(df)} consumption records for unit {cons_unit}")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get consumption data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['datetime', 'consumption'])
+        return _EMPTY_CONSUMPTION.copy()
 
-@st.cache_data(ttl=3600)
+@cached_df
 @retry_on_exception()
-def get_settlement_data_db(plant_id: str, start_date: str, end_date: str) -> pd.DataFrame:
+def _get_consumption_data_for_units(cons_units: tuple, start_date: str, end_date: str, daily: bool) -> pd.DataFrame:
     """
-    Get settlement data from database for a plant and date range.
+    Get consumption summed over several consumption units with one IN query.
     
     Args:
-        plant_id: Plant identifier
+        cons_units: Sorted tuple of consumption unit identifiers (hashable cache key)
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
+        daily: Sum per date instead of per interval
         
     Returns:
-        DataFrame with columns: datetime, cons_unit, allocated_generation, consumption, surplus_demand, deficit
+        DataFrame with columns: date, consumption if daily, else datetime, consumption
     """
+    time_col = 'date' if daily else 'datetime'
+    empty = _EMPTY_DAILY_CONSUMPTION if daily else _EMPTY_UNITS_CONSUMPTION
+    
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Query settlement data - include cons_unit to distinguish between multiple consumption units
-        query = session.query(
-            SettlementData.datetime,
-            SettlementData.cons_unit,
-            SettlementData.allocated_generation,
-            SettlementData.consumption,
-            SettlementData.deficit,
-            SettlementData.surplus_demand,
-            SettlementData.surplus_generation,
-            SettlementData.settled,
-            SettlementData.slot_name,
-            SettlementData.slot_time
-        ).filter(
-            and_(
-                SettlementData.plant_id == plant_id,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
+        with db_session() as session:
+            # The units are summed server-side, so one row per interval (or day) comes back
+            df = _read_frame(
+                session, _DAILY_UNITS_CONSUMPTION_SQL if daily else _UNITS_CONSUMPTION_SQL, [time_col, 'consumption'],
+                date_columns=[time_col], float_columns=['consumption'],
+                params={'cons_units': list(cons_units), 'start_date': start_dt, 'end_date': end_dt}
             )
-        ).order_by(SettlementData.datetime, SettlementData.cons_unit)
-        
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
-        
-        if not result:
-            logger.warning(f"No settlement data found for plant {plant_id} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['datetime', 'cons_unit', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled', 'slot_name', 'slot_time'])
         
-        df = pd.DataFrame(result, columns=['datetime', 'cons_unit', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled', 'slot_name', 'slot_time'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        
-        # Convert numeric columns
-        for col in ['allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled']:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-        
-        logger.info(f"Retrieved {len(df)} settlement records for plant {plant_id} across {df['cons_unit'].nunique()} consumption units")
+        if df.empty:
+            logger.warning(f"No consumption data found for units {', '.join(cons_units)} from {start_date} to {end_date}")
+            return empty.copy()
         
+        logger.info(f"Retrieved {len(df)} consumption records for {len(cons_units)} units")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
-        logger.error(f"Failed to get settlement data from DB: {e}")
+        logger.error(f"Failed to get consumption data for units from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['datetime', 'cons_unit', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled', 'slot_name', 'slot_time'])
+        return empty.copy()
 
-# New SettlementData-based functions using computed datetime approach
-@st.cache_data(ttl=3600)
+def get_consumption_data_db_multi(cons_units: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Get consumption summed over several consumption units in a single round trip.
+    
+    Args:
+        cons_units: Consumption unit identifiers
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        
+    Returns:
+        DataFrame with columns: datetime, consumption
+    """
+    # Drop NULL or blank units: None cannot be sorted with strings and blanks match no row
+    cons_units = tuple(sorted({unit for unit in cons_units if unit}))
+    if not cons_units:
+        return _EMPTY_UNITS_CONSUMPTION.copy()
+    
+    return _get_consumption_data_for_units(cons_units, start_date, end_date, daily=False)
+
+@cached_df
+@disk_cache()
 @retry_on_exception()
-def get_settlement_generation_consumption_data(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+def get_settlement_data_db(plant_id: str, start_date: str, end_date: str, columns: Optional[tuple] = None) -> pd.DataFrame:
     """
-    Get generation and consumption data from SettlementData table using computed datetime.
+    Get settlement data from database for a plant and date range.
     
     Args:
         plant_id: Plant identifier
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
-        plant_type: Plant type ('solar' or 'wind'), optional
+        columns: Optional tuple of settlement columns to fetch (default: all); each
+            distinct tuple is cached separately
         
     Returns:
-        DataFrame with columns: datetime, total_generation, total_consumption
+        DataFrame with columns: datetime, cons_unit, allocated_generation, consumption, deficit,
+        surplus_demand, surplus_generation, settled, slot_name, slot_time (or the requested subset)
     """
+    selected = [col for col in _SETTLEMENT_COLUMNS if columns is None or col in columns]
+    
     try:
-        session = get_db_session()
+        unknown = set(columns or ()) - set(_SETTLEMENT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown settlement columns: {sorted(unknown)}")
         
-        # Convert string dates to datetime objects
+        # Convert string dates to half-open datetime bounds
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
+        start_ts, end_ts = _datetime_bounds(start_dt, end_dt)
+        numeric_columns = [col for col in _NUMERIC_SETTLEMENT_COLS if col in selected]
+        category_columns = [col for col in _CATEGORY_SETTLEMENT_COLS if col in selected]
+        
+        with db_session() as session:
+            # Query settlement data - cons_unit (when selected) distinguishes multiple consumption units.
+            # Filtering on the datetime range lets ix_settle_plant_datetime_unit return rows
+            # already in ORDER BY order, so MySQL skips the filesort
+            query = session.query(
+                *[getattr(SettlementData, col) for col in selected]
+            ).filter(
+                and_(
+                    SettlementData.plant_id == plant_id,
+                    SettlementData.datetime >= start_ts,
+                    SettlementData.datetime < end_ts
+                )
+            ).order_by(SettlementData.datetime, SettlementData.cons_unit)
         
-        # Create computed datetime using func.timestamp
-        computed_datetime = func.timestamp(SettlementData.date, SettlementData.time)
-        
-        # Build query with computed datetime
-        query = session.query(
-            SettlementData.plant_id,
-            SettlementData.type,
-            computed_datetime.label('datetime'),
-            func.sum(SettlementData.allocated_generation).label('total_generation'),
-            func.sum(SettlementData.consumption).label('total_consumption')
-        ).filter(
-            and_(
-                SettlementData.plant_id == plant_id,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
-            )
-        )
-        
-        # Add plant type filter if specified
-        if plant_type:
-            query = query.filter(SettlementData.type == plant_type)
-        
-        # Group by plant_id, type, and computed datetime
-        query = query.group_by(
-            SettlementData.plant_id, 
-            SettlementData.type, 
-            computed_datetime
-        ).order_by(computed_datetime)
-        
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
+            # Read rows straight into typed columns
+            df = _read_frame(session, query, selected, numeric_columns=numeric_columns,
+                             date_columns=['datetime'] if 'datetime' in selected else None, stream=True)
+            df = _compact(df, numeric_columns, category_columns)
         
-        if not result:
+        if df.empty:
             logger.warning(f"No settlement data found for plant {plant_id} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['plant_id', 'type', 'datetime', 'total_generation', 'total_consumption'])
+            return _EMPTY_SETTLEMENT[selected].copy()
         
-        df = pd.DataFrame(result, columns=['plant_id', 'type', 'datetime', 'total_generation', 'total_consumption'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
+        logger.info(f"Retrieved {len(df)} settlement records for plant {plant_id}")
         
-        # Convert numeric columns
-        for col in ['total_generation', 'total_consumption']:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-        
-        logger.info(f"Retrieved {len(df)} settlement generation-consumption records for plant {plant_id}")
-       
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
-        logger.error(f"Failed to get settlement generation-consumption data from DB: {e}")
+        logger.error(f"Failed to get settlement data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['plant_id', 'type', 'datetime', 'total_generation', 'total_consumption'])
+        return _EMPTY_SETTLEMENT[selected].copy()
 
-@st.cache_data(ttl=3600)
+# New SettlementData-based functions using computed datetime approach
+@cached_df
 @retry_on_exception()
-def get_settlement_generation_data(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+def _settlement_wide(plant_id: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
-    Get generation data from SettlementData table using computed datetime.
+    Get every settlement interval of a plant with the columns the summary views need.
+    One query and one cache entry serve the per-interval sums and the ToD aggregation,
+    which are derived from this frame in pandas.
     
     Args:
         plant_id: Plant identifier
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
-        plant_type: Plant type ('solar' or 'wind'), optional
         
     Returns:
-        DataFrame with columns: datetime, total_generation
+        DataFrame with columns: plant_id, type, datetime, allocated_generation, consumption, deficit, surplus_demand
     """
     try:
-        session = get_db_session()
-        
-        # Convert string dates to datetime objects
+        # Convert string dates to half-open datetime bounds
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        # Create computed datetime using func.timestamp
-        computed_datetime = func.timestamp(SettlementData.date, SettlementData.time)
-        
-        # Build query with computed datetime
-        query = session.query(
-            SettlementData.plant_id,
-            SettlementData.type,
-            computed_datetime.label('datetime'),
-            func.sum(SettlementData.allocated_generation).label('total_generation')
-        ).filter(
-            and_(
-                SettlementData.plant_id == plant_id,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
+        start_ts, end_ts = _datetime_bounds(start_dt, end_dt)
+        
+        with db_session() as session:
+            # datetime is the stored generated column TIMESTAMP(date, time), so the
+            # range filter uses the (plant_id, datetime) index
+            query = session.query(
+                SettlementData.plant_id,
+                SettlementData.type,
+                SettlementData.datetime,
+                SettlementData.allocated_generation,
+                SettlementData.consumption,
+                SettlementData.deficit,
+                SettlementData.surplus_demand
+            ).filter(
+                and_(
+                    SettlementData.plant_id == plant_id,
+                    SettlementData.datetime >= start_ts,
+                    SettlementData.datetime < end_ts
+                )
             )
-        )
-        
-        # Add plant type filter if specified
-        if plant_type:
-            query = query.filter(SettlementData.type == plant_type)
-        
-        # Group by plant_id, type, and computed datetime
-        query = query.group_by(
-            SettlementData.plant_id, 
-            SettlementData.type, 
-            computed_datetime
-        ).order_by(computed_datetime)
         
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
-        
-        if not result:
-            logger.warning(f"No settlement generation data found for plant {plant_id} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['plant_id', 'type', 'datetime', 'total_generation'])
+            # Read rows straight into typed columns; numbers stay float64 so derived totals keep full precision
+            df = _read_frame(session, query, _SETTLEMENT_WIDE_COLUMNS, numeric_columns=_SETTLEMENT_WIDE_COLUMNS[3:], date_columns=['datetime'], stream=True)
         
-        df = pd.DataFrame(result, columns=['plant_id', 'type', 'datetime', 'total_generation'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        df['total_generation'] = pd.to_numeric(df['total_generation'], errors='coerce').fillna(0)
+        if df.empty:
+            return _EMPTY_SETTLEMENT_WIDE.copy()
         
-        logger.info(f"Retrieved {len(df)} settlement generation records for plant {plant_id}")
+        logger.info(f"Retrieved {len(df)} settlement intervals for plant {plant_id} from {start_date} to {end_date}")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
-        logger.error(f"Failed to get settlement generation data from DB: {e}")
+        logger.error(f"Failed to get settlement intervals from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['plant_id', 'type', 'datetime', 'total_generation'])
+        return _EMPTY_SETTLEMENT_WIDE.copy()
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 @retry_on_exception()
-def get_settlement_consumption_data(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+def _get_plant_types() -> Dict[str, str]:
     """
-    Get consumption data from SettlementData table using computed datetime.
+    Get the type of every plant from tbl_plants.
+    
+    Returns:
+        Dictionary of plant_id to 'solar' or 'wind'
+    """
+    with db_session() as session:
+        return dict(session.query(TblPlants.plant_id, TblPlants.type).all())
+
+def _settlement_wide_for_type(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+    """Shared settlement intervals of a plant, optionally limited to one plant type"""
+    df = _settlement_wide(plant_id, start_date, end_date)
+    if plant_type:
+        df = df[df['type'] == plant_type]
+    return df
+
+@cached_df
+def _get_settlement_sums(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+    """
+    Get summed generation and consumption per interval from SettlementData.
+    Shared by the generation, consumption and combined settlement getters so
+    one cache entry serves all three.
     
     Args:
         plant_id: Plant identifier
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
-        plant_type: Plant type ('solar' or 'wind'), optional
+        plant_type: Plant type ('solar' or 'wind'); defaults to the plant's type in tbl_plants
         
     Returns:
-        DataFrame with columns: datetime, total_consumption
+        DataFrame with columns: plant_id, type, datetime, total_generation, total_consumption
     """
     try:
-        session = get_db_session()
-        
-        # Convert string dates to datetime objects
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        # Create computed datetime using func.timestamp
-        computed_datetime = func.timestamp(SettlementData.date, SettlementData.time)
-        
-        # Build query with computed datetime
-        query = session.query(
-            SettlementData.plant_id,
-            SettlementData.type,
-            computed_datetime.label('datetime'),
-            func.sum(SettlementData.consumption).label('total_consumption')
-        ).filter(
-            and_(
-                SettlementData.plant_id == plant_id,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
-            )
-        )
-        
-        # Add plant type filter if specified
-        if plant_type:
-            query = query.filter(SettlementData.type == plant_type)
+        wide_df = _settlement_wide_for_type(plant_id, start_date, end_date, plant_type or _get_plant_types().get(plant_id))
         
-        # Group by plant_id, type, and computed datetime
-        query = query.group_by(
-            SettlementData.plant_id, 
-            SettlementData.type, 
-            computed_datetime
-        ).order_by(computed_datetime)
-        
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
-        
-        if not result:
-            logger.warning(f"No settlement consumption data found for plant {plant_id} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['plant_id', 'type', 'datetime', 'total_consumption'])
-        
-        df = pd.DataFrame(result, columns=['plant_id', 'type', 'datetime', 'total_consumption'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        df['total_consumption'] = pd.to_numeric(df['total_consumption'], errors='coerce').fillna(0)
+        if wide_df.empty:
+            logger.warning(f"No settlement data found for plant {plant_id} from {start_date} to {end_date}")
+            return _EMPTY_SETTLEMENT_SUMS.copy()
         
-        logger.info(f"Retrieved {len(df)} settlement consumption records for plant {plant_id}")
+        # Sum the consumption units of each interval
+        df = wide_df.groupby(['plant_id', 'type', 'datetime'], as_index=False)[['allocated_generation', 'consumption']].sum()
+        df = df.rename(columns={'allocated_generation': 'total_generation', 'consumption': 'total_consumption'})
+        df = df.sort_values('datetime', kind='stable', ignore_index=True)
         
+        logger.info(f"Retrieved {len(df)} settlement generation-consumption records for plant {plant_id}")
+       
         return df
         
     except Exception as e:
-        logger.error(f"Failed to get settlement consumption data from DB: {e}")
+        logger.error(f"Failed to get settlement generation-consumption data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['plant_id', 'type', 'datetime', 'total_consumption'])
+        return _EMPTY_SETTLEMENT_SUMS.copy()
 
-@st.cache_data(ttl=3600)
+def get_settlement_generation_consumption_data(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+    """
+    Get generation and consumption data from SettlementData table using computed datetime.
+    
+    Args:
+        plant_id: Plant identifier
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        plant_type: Plant type ('solar' or 'wind'); defaults to the plant's type in tbl_plants
+        
+    Returns:
+        DataFrame with columns: datetime, total_generation, total_consumption
+    """
+    return _get_settlement_sums(plant_id, start_date, end_date, plant_type)
+
+def get_settlement_generation_data(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+    """
+    Get generation data from SettlementData table using computed datetime.
+    
+    Args:
+        plant_id: Plant identifier
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        plant_type: Plant type ('solar' or 'wind'); defaults to the plant's type in tbl_plants
+        
+    Returns:
+        DataFrame with columns: datetime, total_generation
+    """
+    return _get_settlement_sums(plant_id, start_date, end_date, plant_type).drop(columns=['total_consumption'])
+
+def get_settlement_consumption_data(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
+    """
+    Get consumption data from SettlementData table using computed datetime.
+    
+    Args:
+        plant_id: Plant identifier
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        plant_type: Plant type ('solar' or 'wind'); defaults to the plant's type in tbl_plants
+        
+    Returns:
+        DataFrame with columns: datetime, total_consumption
+    """
+    return _get_settlement_sums(plant_id, start_date, end_date, plant_type).drop(columns=['total_generation'])
+
+@cached_df
 @retry_on_exception()
 def get_settlement_combined_client_data(client_name: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -506,55 +876,55 @@ def get_settlement_combined_client_data(client_name: str, start_date: str, end_d
         DataFrame with columns: datetime, type, total_generation
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Create computed datetime using func.timestamp
-        computed_datetime = func.timestamp(SettlementData.date, SettlementData.time)
-        
-        # Build query with computed datetime, grouping by client and type
-        query = session.query(
-            SettlementData.client_name,
-            SettlementData.type,
-            computed_datetime.label('datetime'),
-            func.sum(SettlementData.allocated_generation).label('total_generation')
-        ).filter(
-            and_(
-                SettlementData.client_name == client_name,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
-            )
-        ).group_by(
-            SettlementData.client_name,
-            SettlementData.type, 
-            computed_datetime
-        ).order_by(computed_datetime, SettlementData.type)
-        
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
-        
-        if not result:
+        start_ts, end_ts = _datetime_bounds(start_dt, end_dt)
+        
+        with db_session() as session:
+            # datetime is the stored generated column TIMESTAMP(date, time), so
+            # grouping and ordering on it can use the (plant_id/client_name, datetime) indexes
+            computed_datetime = SettlementData.datetime
+        
+            # Build query with computed datetime, grouping by client and type
+            query = session.query(
+                SettlementData.client_name,
+                SettlementData.type,
+                computed_datetime.label('datetime'),
+                func.sum(SettlementData.allocated_generation).label('total_generation')
+            ).filter(
+                and_(
+                    SettlementData.client_name == client_name,
+                    computed_datetime >= start_ts,
+                    computed_datetime < end_ts
+                )
+            ).group_by(
+                SettlementData.client_name,
+                SettlementData.type, 
+                computed_datetime
+            ).order_by(computed_datetime, SettlementData.type)
+        
+            # Read rows straight into typed columns; the repeated client and type labels are
+            # cached as categoricals, while the summed generation stays float64
+            df = _read_frame(session, query, ['client_name', 'type', 'datetime', 'total_generation'], numeric_columns=['total_generation'], date_columns=['datetime'])
+            df = _compact(df, [], ['client_name', 'type'])
+        
+        if df.empty:
             logger.warning(f"No settlement data found for client {client_name} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['client_name', 'type', 'datetime', 'total_generation'])
-        
-        df = pd.DataFrame(result, columns=['client_name', 'type', 'datetime', 'total_generation'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        df['total_generation'] = pd.to_numeric(df['total_generation'], errors='coerce').fillna(0)
+            return _EMPTY_COMBINED_CLIENT.copy()
         
         logger.info(f"Retrieved {len(df)} settlement combined records for client {client_name}")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get settlement combined client data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['client_name', 'type', 'datetime', 'total_generation'])
+        return _EMPTY_COMBINED_CLIENT.copy()
 
-@st.cache_data(ttl=3600)
-@retry_on_exception()
+@cached_df
 def get_settlement_tod_aggregated_data(plant_id: str, start_date: str, end_date: str, plant_type: str = None) -> pd.DataFrame:
     """
     Get Time-of-Day aggregated data from SettlementData table using computed datetime approach.
@@ -570,92 +940,35 @@ def get_settlement_tod_aggregated_data(plant_id: str, start_date: str, end_date:
         DataFrame with ToD analysis using computed datetime
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        # Create computed datetime using func.timestamp
-        computed_datetime = func.timestamp(SettlementData.date, SettlementData.time)
-        
-        # Get ToD slots configuration
-        from backend.config.tod_config import get_tod_slots
-        tod_slots = get_tod_slots()
-        
-        # Create a CASE statement for ToD bin assignment
-        tod_case_conditions = []
-        for slot_name, slot_info in tod_slots.items():
-            start_hour = slot_info['start_hour']
-            end_hour = slot_info['end_hour']
-            
-            if start_hour <= end_hour:
-                # Normal case (doesn't cross midnight)
-                condition = and_(
-                    func.hour(computed_datetime) >= start_hour,
-                    func.hour(computed_datetime) < end_hour
-                )
-            else:
-                # Crosses midnight case
-                condition = or_(
-                    func.hour(computed_datetime) >= start_hour,
-                    func.hour(computed_datetime) < end_hour
-                )
-            
-            tod_case_conditions.append((condition, slot_name))
-        
-        # Create CASE statement for ToD bin
-        tod_bin_case = case(*tod_case_conditions, else_='Unknown')
-        
-        # Build query with computed datetime and ToD binning
-        query = session.query(
-            SettlementData.plant_id,
-            SettlementData.type,
-            tod_bin_case.label('tod_bin'),
-            func.sum(SettlementData.allocated_generation).label('total_generation'),
-            func.sum(SettlementData.consumption).label('total_consumption'),
-            func.sum(SettlementData.deficit).label('total_deficit'),
-            func.sum(SettlementData.surplus_demand).label('total_surplus_demand'),
-            func.count().label('interval_count')
-        ).filter(
-            and_(
-                SettlementData.plant_id == plant_id,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
-            )
-        )
         
-        # Add plant type filter if specified
-        if plant_type:
-            query = query.filter(SettlementData.type == plant_type)
+        wide_df = _settlement_wide_for_type(plant_id, start_date, end_date, plant_type)
         
-        # Group by plant_id, type, and ToD bin
-        query = query.group_by(
-            SettlementData.plant_id, 
-            SettlementData.type, 
-            tod_bin_case
-        ).order_by(tod_bin_case)
-        
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
-        
-        if not result:
+        if wide_df.empty:
             logger.warning(f"No settlement ToD data found for plant {plant_id} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['plant_id', 'type', 'tod_bin', 'total_generation', 'total_consumption', 'total_deficit', 'total_surplus_demand', 'interval_count'])
-        
-        df = pd.DataFrame(result, columns=['plant_id', 'type', 'tod_bin', 'total_generation', 'total_consumption', 'total_deficit', 'total_surplus_demand', 'interval_count'])
-        
-        # Convert numeric columns
-        for col in ['total_generation', 'total_consumption', 'total_deficit', 'total_surplus_demand', 'interval_count']:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+            return _EMPTY_SETTLEMENT_TOD.copy()
+        
+        # Assign ToD bins from the cached hour map and roll the intervals up to one row per bin
+        df = wide_df.assign(tod_bin=_tod_bins(wide_df['datetime'])).groupby(
+            ['plant_id', 'type', 'tod_bin'], as_index=False, observed=True
+        ).agg(
+            total_generation=('allocated_generation', 'sum'),
+            total_consumption=('consumption', 'sum'),
+            total_deficit=('deficit', 'sum'),
+            total_surplus_demand=('surplus_demand', 'sum'),
+            interval_count=('datetime', 'size')
+        )
+        df['tod_bin'] = df['tod_bin'].astype(str)
         
         # Calculate surplus from generation and consumption
         df['total_surplus'] = df['total_generation'] - df['total_consumption']
         
-        # Add normalized values (per 15-minute interval)
-        for col in ['total_generation', 'total_consumption', 'total_surplus', 'total_deficit', 'total_surplus_demand']:
-            df[f'{col.replace("total_", "")}_normalized'] = df[col] / df['interval_count']
+        # Add normalized values (per 15-minute interval) with one 2D numpy divide
+        total_cols = ['total_generation', 'total_consumption', 'total_surplus', 'total_deficit', 'total_surplus_demand']
+        df[[f'{col.replace("total_", "")}_normalized' for col in total_cols]] = (
+            df[total_cols].to_numpy(dtype=np.float64) / df['interval_count'].to_numpy(dtype=np.float64)[:, None]
+        )
         
         # Add date column for consistency with existing functions
         df['date'] = start_dt
@@ -679,7 +992,7 @@ def get_settlement_tod_aggregated_data(plant_id: str, start_date: str, end_date:
     except Exception as e:
         logger.error(f"Failed to get settlement ToD data using computed datetime: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['plant_id', 'type', 'tod_bin', 'allocated_generation_total', 'consumption_total', 'surplus_total', 'deficit_total', 'surplus_demand_total', 'interval_count', 'date'])
+        return _EMPTY_SETTLEMENT_TOD.copy()
 
 @st.cache_data(ttl=3600)
 @retry_on_exception()
@@ -691,43 +1004,40 @@ def get_plants_from_db() -> Dict:
         Dictionary with plant information organized by client and type
     """
     try:
-        session = get_db_session()
-        
-        # Get unique plants from plants table
-        plants_query = session.query(
-            TblPlants.plant_id,
-            TblPlants.plant_name,
-            TblPlants.client_name,
-            TblPlants.type
-        ).distinct().all()
-        
-        session.close()
+        with db_session() as session:
+            # Get unique plants from plants table in one columnar read
+            plants_df = pd.read_sql(
+                session.query(
+                    TblPlants.plant_id,
+                    TblPlants.plant_name,
+                    TblPlants.client_name,
+                    TblPlants.type
+                ).distinct().statement,
+                session.connection()
+            )
         
         # Organize plants by client and type
-        plants_dict = {}
+        plants_df['plant_name'] = plants_df['plant_name'].fillna(plants_df['plant_id'])
+        plants_df = plants_df.rename(columns={'plant_name': 'name', 'client_name': 'client'})
         
-        for plant_id, plant_name, client_name, plant_type in plants_query:
-            if client_name not in plants_dict:
-                plants_dict[client_name] = {'solar': [], 'wind': []}
-            
-            plant_info = {
-                'plant_id': plant_id,
-                'name': plant_name or plant_id,
-                'client': client_name
+        plants_dict = {}
+        for client_name, client_df in plants_df.groupby('client', sort=False, dropna=False):
+            plants_dict[client_name] = {
+                plant_type: client_df.loc[client_df['type'] == plant_type, ['plant_id', 'name', 'client']].to_dict('records')
+                for plant_type in ('solar', 'wind')
             }
-            
-            if plant_type in ['solar', 'wind']:
-                plants_dict[client_name][plant_type].append(plant_info)
         
-        logger.info(f"Retrieved {len(plants_query)} plants from database")
+        logger.info(f"Retrieved {len(plants_df)} plants from database")
         return plants_dict
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get plants from DB: {e}")
         logger.error(traceback.format_exc())
         return {}
 
-@st.cache_data(ttl=3600)
+@cached_df
 @retry_on_exception()
 def get_daily_aggregated_generation_db(plant_id: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -742,45 +1052,51 @@ def get_daily_aggregated_generation_db(plant_id: str, start_date: str, end_date:
         DataFrame with columns: date, generation
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Query daily aggregated generation data
-        query = session.query(
-            TblGeneration.date,
-            func.sum(TblGeneration.generation).label('generation')
-        ).filter(
-            and_(
-                TblGeneration.plant_id == plant_id,
-                TblGeneration.date >= start_dt,
-                TblGeneration.date <= end_dt
+        params = {'plant_id': plant_id, 'start_date': start_dt, 'end_date': end_dt}
+        
+        with db_session() as session:
+            # Completed days come from the nightly tbl_generation_daily rollup
+            try:
+                rollup_df = _read_frame(
+                    session, _DAILY_GENERATION_ROLLUP_SQL, ['date', 'generation'],
+                    date_columns=['date'], float_columns=['generation'], params={**params, 'today': date.today()}
+                )
+            except ProgrammingError as e:
+                # Databases that predate the rollup have no tbl_generation_daily; aggregate the whole range live
+                logger.warning(f"Daily generation rollup unavailable, aggregating live: {e}")
+                rollup_df = _EMPTY_DAILY_GENERATION.copy()
+            
+            # Today and any days the rollup has not covered yet are aggregated live
+            live_df = _read_frame(
+                session, _DAILY_GENERATION_LIVE_SQL, ['date', 'generation'],
+                date_columns=['date'], float_columns=['generation'],
+                params={**params, 'rollup_dates': rollup_df['date'].dt.date.tolist()}
             )
-        ).group_by(TblGeneration.date).order_by(TblGeneration.date)
         
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
+        if rollup_df.empty:
+            df = live_df.sort_values('date', ignore_index=True)
+        else:
+            df = pd.concat([rollup_df, live_df], ignore_index=True).sort_values('date', ignore_index=True)
         
-        if not result:
+        if df.empty:
             logger.warning(f"No daily generation data found for plant {plant_id}")
-            return pd.DataFrame(columns=['date', 'generation'])
-        
-        df = pd.DataFrame(result, columns=['date', 'generation'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['generation'] = pd.to_numeric(df['generation'], errors='coerce').fillna(0)
+            return _EMPTY_DAILY_GENERATION.copy()
         
         logger.info(f"Retrieved {len(df)} daily generation records for plant {plant_id}")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get daily generation data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['date', 'generation'])
+        return _EMPTY_DAILY_GENERATION.copy()
 
-@st.cache_data(ttl=3600)
+@cached_df
 @retry_on_exception()
 def get_daily_aggregated_consumption_db(cons_unit: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -795,47 +1111,86 @@ def get_daily_aggregated_consumption_db(cons_unit: str, start_date: str, end_dat
         DataFrame with columns: date, consumption
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Query daily aggregated consumption data
-        query = session.query(
-            TblConsumption.date,
-            func.sum(TblConsumption.consumption).label('consumption')
-        ).filter(
-            and_(
-                TblConsumption.cons_unit == cons_unit,
-                TblConsumption.date >= start_dt,
-                TblConsumption.date <= end_dt
+        with db_session() as session:
+            # Read the daily sums straight into typed columns
+            df = _read_frame(
+                session, _DAILY_CONSUMPTION_SQL, ['date', 'consumption'],
+                date_columns=['date'], float_columns=['consumption'],
+                params={'cons_unit': cons_unit, 'start_date': start_dt, 'end_date': end_dt}
             )
-        ).group_by(TblConsumption.date).order_by(TblConsumption.date)
-        
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
         
-        if not result:
+        if df.empty:
             logger.warning(f"No daily consumption data found for unit {cons_unit}")
-            return pd.DataFrame(columns=['date', 'consumption'])
-        
-        df = pd.DataFrame(result, columns=['date', 'consumption'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['consumption'] = pd.to_numeric(df['consumption'], errors='coerce').fillna(0)
+            return _EMPTY_DAILY_CONSUMPTION.copy()
         
         logger.info(f"Retrieved {len(df)} daily consumption records for unit {cons_unit}")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get daily consumption data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['date', 'consumption'])
+        return _EMPTY_DAILY_CONSUMPTION.copy()
 
-@st.cache_data(ttl=3600)
+def get_daily_aggregated_consumption_db_multi(cons_units: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Get daily consumption summed over several consumption units in a single round trip.
+    
+    Args:
+        cons_units: Consumption unit identifiers
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        
+    Returns:
+        DataFrame with columns: date, consumption
+    """
+    # Drop NULL or blank units: None cannot be sorted with strings and blanks match no row
+    cons_units = tuple(sorted({unit for unit in cons_units if unit}))
+    if not cons_units:
+        return _EMPTY_DAILY_CONSUMPTION.copy()
+    
+    return _get_consumption_data_for_units(cons_units, start_date, end_date, daily=True)
+
+def _finalize_tod(tod_aggregated: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the derived columns of a ToD aggregate in place.
+    
+    Args:
+        tod_aggregated: Per-bin sums with a categorical tod_bin and an interval_count column
+        
+    Returns:
+        The same DataFrame with string bins, surplus, normalized and total columns
+    """
+    # Hand the (few) result rows back with plain string bins
+    tod_aggregated['tod_bin'] = tod_aggregated['tod_bin'].astype(str)
+    
+    # Surplus (kept for backward compatibility) as the difference of the group sums,
+    # instead of a full-length per-interval column that is only ever summed
+    tod_aggregated.insert(
+        tod_aggregated.columns.get_loc('consumption') + 1, 'surplus',
+        tod_aggregated['allocated_generation'] - tod_aggregated['consumption']
+    )
+    
+    # Normalize to per-interval values - this represents average per 15-minute interval.
+    # One 2D numpy divide fills every normalized column, then the totals are the raw block
+    energy_cols = _TOD_ENERGY_COLS
+    values = tod_aggregated[energy_cols].to_numpy(dtype=np.float64)
+    interval_counts = tod_aggregated['interval_count'].to_numpy(dtype=np.float64)[:, None]
+    tod_aggregated[[f'{col}_normalized' for col in energy_cols]] = values / interval_counts
+    
+    # Add total columns (non-normalized) for cases where we need actual totals
+    tod_aggregated[[f'{col}_total' for col in energy_cols]] = values
+    
+    return tod_aggregated
+
+@cached_df
 @retry_on_exception()
-def get_tod_aggregated_data_db(plant_id: str, start_date: str, end_date: str) -> pd.DataFrame:
+def get_tod_aggregated_data_db(plant_id: str, start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
     """
     Get Time-of-Day aggregated data from database.
     
@@ -845,81 +1200,45 @@ def get_tod_aggregated_data_db(plant_id: str, start_date: str, end_date: str) ->
         end_date: End date (YYYY-MM-DD)
         
     Returns:
-        DataFrame with ToD analysis
+        Dictionary with 'daily' (per date and ToD bin, for daily comparison charts) and
+        'total' (per ToD bin across the range, for ToD comparison charts) DataFrames.
+        For a single day both hold the same data; both are empty if there is none
     """
     try:
-        # Get settlement data first
-        settlement_df = get_settlement_data_db(plant_id, start_date, end_date)
+        # Get settlement data first, limited to the columns aggregated below
+        settlement_df = get_settlement_data_db(
+            plant_id, start_date, end_date,
+            columns=('datetime', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand')
+        )
         
         if settlement_df.empty:
-            return pd.DataFrame()
-        
-        # Get ToD slots configuration
-        tod_slots = get_tod_slots()
-        
-        def assign_tod_bin(hour):
-            """Assign ToD bin based on hour"""
-            for slot_name, slot_info in tod_slots.items():
-                start_hour = slot_info['start_hour']
-                end_hour = slot_info['end_hour']
-                
-                if start_hour <= end_hour:
-                    if start_hour <= hour < end_hour:
-                        return slot_name
-                else:  # Crosses midnight
-                    if hour >= start_hour or hour < end_hour:
-                        return slot_name
-            return 'Unknown'
-        
-        # Add ToD bin column
-        settlement_df['hour'] = settlement_df['datetime'].dt.hour
-        settlement_df['date'] = settlement_df['datetime'].dt.date
-        settlement_df['tod_bin'] = settlement_df['hour'].apply(assign_tod_bin)
-        
-        # Add surplus column for backward compatibility
-        settlement_df['surplus'] = settlement_df['allocated_generation'] - settlement_df['consumption']
-        
-        # Check if this is a multi-day analysis
-        start_date_obj = pd.to_datetime(start_date).date()
-        end_date_obj = pd.to_datetime(end_date).date()
-        is_multi_day = start_date_obj != end_date_obj
+            return {'daily': _EMPTY_TOD_DAILY.copy(), 'total': _EMPTY_TOD_TOTAL.copy()}
+        
+        # The energy columns arrive as float32 from get_settlement_data_db. Add a datetime64
+        # date key and a Categorical ToD bin so the groupbys below hash narrow typed keys
+        settlement_df['date'] = settlement_df['datetime'].dt.normalize()
+        settlement_df['tod_bin'] = _tod_bins(settlement_df['datetime'])
+        
+        # Check if this is a multi-day analysis, comparing day-floored Timestamps like the date key
+        start_day = pd.Timestamp(start_date).floor('D')
+        end_day = pd.Timestamp(end_date).floor('D')
+        is_multi_day = start_day != end_day
         
         if is_multi_day:
-            # For multi-day analysis, we need to provide both:
-            # 1. Daily breakdown (for daily comparison charts)
-            # 2. Total aggregation across all days (for ToD comparison charts)
+            # Daily breakdown by date and ToD bin, counting intervals in the same pass
+            daily_tod_aggregated = settlement_df.groupby(['date', 'tod_bin'], observed=True).agg(
+                allocated_generation=('allocated_generation', 'sum'),
+                consumption=('consumption', 'sum'),
+                surplus_demand=('surplus_demand', 'sum'),
+                deficit=('deficit', 'sum'),
+                interval_count=('tod_bin', 'size')
+            ).reset_index()
             
-            # First, create daily breakdown by date and ToD bin
-            daily_tod_aggregated = settlement_df.groupby(['date', 'tod_bin']).agg({
-                'allocated_generation': 'sum',
-                'consumption': 'sum',
-                'surplus': 'sum',
-                'surplus_demand': 'sum',
-                'deficit': 'sum'
-            }).reset_index()
-            
-            # Count intervals per date and ToD bin for daily data
-            daily_interval_counts = settlement_df.groupby(['date', 'tod_bin']).size().reset_index(name='interval_count')
-            daily_tod_aggregated = daily_tod_aggregated.merge(daily_interval_counts, on=['date', 'tod_bin'])
-            
-            # For multi-day ToD comparison, aggregate across all days by ToD bin only
-            # This gives us the total for each ToD bin across all selected days
-            total_tod_aggregated = settlement_df.groupby('tod_bin').agg({
-                'allocated_generation': 'sum',
-                'consumption': 'sum',
-                'surplus': 'sum',
-                'surplus_demand': 'sum',
-                'deficit': 'sum'
-            }).reset_index()
-            
-            # Count total intervals per ToD bin across all days
-            total_interval_counts = settlement_df.groupby('tod_bin').size().reset_index(name='total_interval_count')
-            total_tod_aggregated = total_tod_aggregated.merge(total_interval_counts, on='tod_bin')
-            
-            # Add date column to total aggregated data to maintain consistency
-            # Use the start_date as representative date for total aggregation
-            total_tod_aggregated['date'] = start_date_obj
-            total_tod_aggregated['interval_count'] = total_tod_aggregated['total_interval_count']
+            # Total aggregation across all days by ToD bin only.
+            # Re-summing the small daily breakdown avoids a second scan of the raw intervals
+            total_tod_aggregated = daily_tod_aggregated.groupby('tod_bin', observed=True)[
+                ['allocated_generation', 'consumption', 'surplus_demand', 'deficit', 'interval_count']
+            ].sum().reset_index()
             
             # Log the totals for debugging
             logger.info(f"Multi-day ToD aggregation for plant {plant_id}:")
@@ -928,45 +1247,40 @@ def get_tod_aggregated_data_db(plant_id: str, start_date: str, end_date: str) ->
             logger.info(f"Total generation across all days and ToD bins: {total_tod_aggregated['allocated_generation'].sum():.2f} kWh")
             logger.info(f"Total consumption across all days and ToD bins: {total_tod_aggregated['consumption'].sum():.2f} kWh")
             
-            # Combine both datasets - daily breakdown + total aggregation
-            # The visualization layer can choose which one to use based on the plot type
-            tod_aggregated = pd.concat([daily_tod_aggregated, total_tod_aggregated], ignore_index=True)
+            tod_data = {
+                'daily': _finalize_tod(daily_tod_aggregated),
+                'total': _finalize_tod(total_tod_aggregated)
+            }
             
         else:
-            # For single-day analysis, aggregate by ToD bin only
-            tod_aggregated = settlement_df.groupby('tod_bin').agg({
-                'allocated_generation': 'sum',
-                'consumption': 'sum',
-                'surplus': 'sum',
-                'surplus_demand': 'sum',
-                'deficit': 'sum'
-            }).reset_index()
-            
-            # Calculate normalized values (per 15-minute interval)
-            # Count intervals per ToD bin
-            interval_counts = settlement_df.groupby('tod_bin').size().reset_index(name='interval_count')
-            tod_aggregated = tod_aggregated.merge(interval_counts, on='tod_bin')
+            # For single-day analysis, aggregate by ToD bin only, counting the intervals
+            # used for the normalized values in the same pass
+            tod_aggregated = settlement_df.groupby('tod_bin', observed=True).agg(
+                allocated_generation=('allocated_generation', 'sum'),
+                consumption=('consumption', 'sum'),
+                surplus_demand=('surplus_demand', 'sum'),
+                deficit=('deficit', 'sum'),
+                interval_count=('tod_bin', 'size')
+            ).reset_index()
             
             # Add date column for consistency
-            tod_aggregated['date'] = start_date_obj
-        
-        # Normalize to per-interval values - this represents average per 15-minute interval
-        for col in ['allocated_generation', 'consumption', 'surplus', 'surplus_demand', 'deficit']:
-            tod_aggregated[f'{col}_normalized'] = tod_aggregated[col] / tod_aggregated['interval_count']
-        
-        # Add total columns (non-normalized) for cases where we need actual totals
-        for col in ['allocated_generation', 'consumption', 'surplus', 'surplus_demand', 'deficit']:
-            tod_aggregated[f'{col}_total'] = tod_aggregated[col]
+            tod_aggregated['date'] = start_day
+            
+            # The day's breakdown is also its total
+            tod_aggregated = _finalize_tod(tod_aggregated)
+            tod_data = {'daily': tod_aggregated, 'total': tod_aggregated}
         
         logger.info(f"Generated ToD aggregated data for plant {plant_id}")
-        return tod_aggregated
+        return tod_data
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get ToD aggregated data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame()
+        return {'daily': _EMPTY_TOD_DAILY.copy(), 'total': _EMPTY_TOD_TOTAL.copy()}
 
-@st.cache_data(ttl=3600)
+@cached_df
 @retry_on_exception()
 def get_combined_plants_data_db(client_name: str, plant_type: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -982,44 +1296,105 @@ def get_combined_plants_data_db(client_name: str, plant_type: str, start_date: s
         DataFrame with combined generation data
     """
     try:
-        session = get_db_session()
-        
         # Convert string dates to datetime objects
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Query combined generation data for all plants of the type
-        query = session.query(
-            TblGeneration.datetime,
-            func.sum(TblGeneration.generation).label('generation')
-        ).filter(
-            and_(
-                TblGeneration.client_name == client_name,
-                TblGeneration.type == plant_type,
-                TblGeneration.date >= start_dt,
-                TblGeneration.date <= end_dt
+        with db_session() as session:
+            # Combined generation of all plants of the type, one row per interval over possibly
+            # long ranges, so it is streamed in batches; the SQL already yields floats with NULL as 0
+            df = _read_frame(
+                session, _COMBINED_GENERATION_SQL, ['datetime', 'generation'],
+                date_columns=['datetime'], float_columns=['generation'], stream=True,
+                params={'client_name': client_name, 'plant_type': plant_type, 'start_date': start_dt, 'end_date': end_dt}
             )
-        ).group_by(TblGeneration.datetime).order_by(TblGeneration.datetime)
-        
-        # Execute query and convert to DataFrame
-        result = query.all()
-        session.close()
         
-        if not result:
+        if df.empty:
             logger.warning(f"No combined {plant_type} data found for client {client_name}")
-            return pd.DataFrame(columns=['datetime', 'generation'])
-        
-        df = pd.DataFrame(result, columns=['datetime', 'generation'])
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        df['generation'] = pd.to_numeric(df['generation'], errors='coerce').fillna(0)
+            return _EMPTY_COMBINED_GENERATION.copy()
         
         logger.info(f"Retrieved {len(df)} combined {plant_type} records for client {client_name}")
         return df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get combined plants data from DB: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame(columns=['datetime', 'generation'])
+        return _EMPTY_COMBINED_GENERATION.copy()
+
+def _plant_name_key(plant) -> Optional[str]:
+    """Plant name of a plant name or plant dict (None for dicts without a name)"""
+    return plant.get('name') if isinstance(plant, dict) else plant
+
+def _collation_key(value: str) -> str:
+    """Comparison key matching MySQL's case-insensitive, trailing-space-insensitive collation"""
+    return value.rstrip(' ').lower()
+
+@st.cache_data(ttl=3600)
+def _get_plant_ids_cached(plant_names: tuple) -> Dict[str, str]:
+    """Plant IDs keyed by the requested spelling of each name in a sorted tuple; database errors propagate so they are not cached"""
+    with db_session() as session:
+        rows = session.execute(_PLANT_IDS_BY_NAMES_SQL, {'plant_names': list(plant_names)}).all()
+    
+    # The IN match follows the column collation, so map rows back through the same key
+    ids_by_key = {_collation_key(plant_name): plant_id for plant_name, plant_id in rows}
+    return {
+        name: ids_by_key[_collation_key(name)]
+        for name in plant_names
+        if _collation_key(name) in ids_by_key
+    }
+
+@st.cache_data(ttl=3600)
+def _get_cons_units_cached(plant_ids: tuple) -> Dict[str, tuple]:
+    """Consumption units settled against each plant of a sorted tuple, keyed by the requested plant IDs; database errors propagate so they are not cached"""
+    with db_session() as session:
+        rows = session.execute(_CONS_UNITS_BY_PLANTS_SQL, {'plant_ids': list(plant_ids)}).all()
+    
+    units_by_key = {}
+    for plant_id, cons_unit in rows:
+        units_by_key.setdefault(_collation_key(plant_id), []).append(cons_unit)
+    return {plant_id: tuple(units_by_key.get(_collation_key(plant_id), ())) for plant_id in plant_ids}
+
+def get_plant_ids_from_names(plant_names: List) -> Dict[str, str]:
+    """
+    Get plant IDs for several plants with a single query.
+    
+    Args:
+        plant_names: Plant names or plant objects
+        
+    Returns:
+        Dictionary of plant name to plant ID (names without a match are omitted)
+    """
+    try:
+        names = tuple(sorted({name for name in map(_plant_name_key, plant_names) if name}))
+        if not names:
+            return {}
+        return dict(_get_plant_ids_cached(names))
+    
+    except Exception as e:
+        logger.error(f"Failed to get plant IDs from names: {e}")
+        return {}
+
+def get_consumption_units_for_plants(plant_ids: List[str]) -> Dict[str, List[str]]:
+    """
+    Get the consumption units of several plants with a single query.
+    
+    Args:
+        plant_ids: Plant identifiers
+        
+    Returns:
+        Dictionary of plant ID to list of consumption units (empty list if none)
+    """
+    try:
+        ids = tuple(sorted(set(plant_ids)))
+        if not ids:
+            return {}
+        return {plant_id: list(units) for plant_id, units in _get_cons_units_cached(ids).items()}
+    
+    except Exception as e:
+        logger.error(f"Failed to get consumption units for plants: {e}")
+        return {}
 
 def get_plant_id_from_name(plant_name) -> Optional[str]:
     """
@@ -1044,17 +1419,11 @@ def get_plant_id_from_name(plant_name) -> Optional[str]:
         else:
             actual_plant_name = plant_name
         
-        session = get_db_session()
-        
-        # Query to find plant_id by plant_name
-        result = session.query(TblGeneration.plant_id).filter(
-            TblGeneration.plant_name == actual_plant_name
-        ).first()
-        
-        session.close()
+        # Plant metadata rarely changes, so repeated lookups are served from cache
+        result = _get_plant_ids_cached((actual_plant_name,)).get(actual_plant_name)
         
         if result:
-            return result[0]
+            return result
         else:
             logger.warning(f"Plant ID not found for plant name: {actual_plant_name}")
             return None
@@ -1075,8 +1444,6 @@ def get_consumption_unit_from_plant(plant_name) -> List[str]:
         List of consumption unit identifiers
     """
     try:
-        session = get_db_session()
-        
         # Handle case where plant_name is actually a plant object/dict
         if isinstance(plant_name, dict):
             if 'plant_id' in plant_name:
@@ -1094,18 +1461,12 @@ def get_consumption_unit_from_plant(plant_name) -> List[str]:
             logger.warning(f"Could not determine plant_id for: {plant_name}")
             return []
         
-        # Query to find all consumption units associated with the plant
-        results = session.query(SettlementData.cons_unit).filter(
-            SettlementData.plant_id == plant_id
-        ).distinct().all()
+        # Find all consumption units associated with the plant (cached per plant)
+        cons_units = _get_cons_units_cached((plant_id,))[plant_id]
         
-        session.close()
-        
-        if results:
-            # Extract consumption units from results
-            cons_units = [result[0] for result in results]
+        if cons_units:
             logger.info(f"Found {len(cons_units)} consumption units for plant: {plant_name}")
-            return cons_units
+            return list(cons_units)
         else:
             logger.warning(f"No consumption units found for plant: {plant_name}")
             return []
@@ -1115,8 +1476,51 @@ def get_consumption_unit_from_plant(plant_name) -> List[str]:
         return []
 
 
-@st.cache_data(ttl=3600)
+@cached_df
 @retry_on_exception()
+def _fetch_banking_aggregates(plant_name: str, client_name: str = None) -> pd.DataFrame:
+    """
+    Sum every banking settlement measure by month and ToD slot in a single query.
+    
+    Both monthly banking views read these sums, so they share one scan of
+    banking_settlement (and one cache entry) instead of running two GROUP BYs.
+    
+    Args:
+        plant_name: Name of the plant ("Combined View" for all plants)
+        client_name: Optional client name for filtering
+    
+    Returns:
+        DataFrame with one row per month, slot_name and slot_time
+    """
+    try:
+        with db_session() as session:
+            # Group on the raw date column so MySQL can walk ix_banking_client_plant_date_slot;
+            # it is rendered as text (and any NULL as 'N/A') client-side below
+            by_plant = plant_name != "Combined View"
+            by_client = bool(client_name)
+            results = session.execute(
+                _BANKING_AGGREGATES_SQL[(by_plant, by_client)],
+                {'plant_name': plant_name, 'client_name': client_name}
+            ).all()
+        
+        if not results:
+            return _EMPTY_BANKING_AGGREGATES.copy()
+        
+        # Build the frame from the row tuples in one call, then convert the Decimal sums column-wise
+        df = pd.DataFrame.from_records(results, columns=_BANKING_AGGREGATE_COLUMNS)
+        df['month'] = df['month'].map(str, na_action='ignore').fillna('N/A')
+        df[_NUMERIC_BANKING_COLS] = df[_NUMERIC_BANKING_COLS].apply(pd.to_numeric, errors='coerce').astype('float64').fillna(0.0)
+        
+        return df
+        
+    except (OperationalError, InterfaceError):
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get banking settlement aggregates: {e}")
+        logger.error(traceback.format_exc())
+        return _EMPTY_BANKING_AGGREGATES.copy()
+
+
 def get_monthly_before_banking_settlement_data_db(plant_name: str, client_name: str = None) -> pd.DataFrame:
     """
     Get monthly aggregated BEFORE banking settlement data for ToD visualization.
@@ -1130,71 +1534,19 @@ def get_monthly_before_banking_settlement_data_db(plant_name: str, client_name:
         DataFrame with monthly before banking settlement data by ToD slots
     """
     try:
-        session = get_db_session()
-        
-        # Build query with proper date handling
-        # Since date is stored as string in 'YYYY-MM' format, cast it properly
-        query = session.query(
-            func.coalesce(func.cast(BankingSettlement.date, String), 'N/A').label('month'),
-            BankingSettlement.slot_name,
-            BankingSettlement.slot_time,
-            func.sum(func.coalesce(BankingSettlement.surplus_generation_sum, 0)).label('total_generation'),
-            func.sum(func.coalesce(BankingSettlement.surplus_demand_sum, 0)).label('total_consumption'),
-            func.sum(func.coalesce(BankingSettlement.matched_settled_sum, 0)).label('settled_units_with_banking'),
-            func.sum(func.coalesce(BankingSettlement.intra_settlement, 0)).label('intra_settlement'),
-            func.sum(func.coalesce(BankingSettlement.inter_settlement, 0)).label('inter_settlement'),
-            func.sum(func.coalesce(BankingSettlement.surplus_generation_sum_after_inter, 0)).label('surplus_generation_after_banking'),
-            func.sum(func.coalesce(BankingSettlement.surplus_demand_sum_after_inter, 0)).label('surplus_demand_after_banking')
-        )
-        
-        # Apply filters
-        if plant_name != "Combined View":
-            query = query.filter(BankingSettlement.plant_name == plant_name)
-        
-        if client_name:
-            query = query.filter(BankingSettlement.client_name == client_name)
-        
-        # Group by month and slot
-        query = query.group_by(
-            func.coalesce(func.cast(BankingSettlement.date, String), 'N/A'),
-            BankingSettlement.slot_name,
-            BankingSettlement.slot_time
-        ).order_by(
-            func.coalesce(func.cast(BankingSettlement.date, String), 'N/A'),
-            BankingSettlement.slot_name
-        )
-        
-        results = query.all()
-        session.close()
+        df = _fetch_banking_aggregates(plant_name, client_name)
         
-        if not results:
+        if df.empty:
             logger.warning(f"No banking settlement data found for plant: {plant_name}")
-            return pd.DataFrame()
-        
-        # Convert to DataFrame
-        data = []
-        for result in results:
-            data.append({
-                'month': result.month,
-                'slot_name': result.slot_name,
-                'slot_time': result.slot_time,
-                'total_generation': float(result.total_generation or 0),
-                'total_consumption': float(result.total_consumption or 0),
-                'settled_units_with_banking': float(result.settled_units_with_banking or 0),
-                'intra_settlement': float(result.intra_settlement or 0),
-                'inter_settlement': float(result.inter_settlement or 0),
-                'surplus_generation_after_banking': float(result.surplus_generation_after_banking or 0),
-                'surplus_demand_after_banking': float(result.surplus_demand_after_banking or 0)
-            })
-        
-        df = pd.DataFrame(data)
+            return _EMPTY_BANKING_AGGREGATES.copy()
+        
         logger.info(f"Retrieved {len(df)} banking settlement records for plant: {plant_name}")
         return df
         
     except Exception as e:
         logger.error(f"Failed to get monthly banking settlement data: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame()
+        return _EMPTY_BANKING_AGGREGATES.copy()
 
 
 def get_monthly_energy_metrics_data_db(plant_name: str, client_name: str = None) -> pd.DataFrame:
@@ -1209,70 +1561,37 @@ def get_monthly_energy_metrics_data_db(plant_name: str, client_name: str = None)
         DataFrame with monthly energy metrics data
     """
     try:
-        session = get_db_session()
+        slots_df = _fetch_banking_aggregates(plant_name, client_name)
         
-        # Build query to get aggregated monthly data
-        query = session.query(
-            func.date_format(BankingSettlement.date, '%Y-%m').label('month'),
+        if slots_df.empty:
+            logger.warning(f"No banking settlement data found for plant: {plant_name}")
+            return _EMPTY_BANKING_METRICS.copy()
+        
+        # Roll the (few) per-slot rows up to calendar months
+        slots_df['month'] = slots_df['month'].str[:7]
+        monthly = slots_df.groupby('month').sum(numeric_only=True)
+        
+        df = pd.DataFrame({
             # Settled without banking = matched_settled_sum (initial amount that could be directly matched and settled)
-            func.sum(func.coalesce(BankingSettlement.matched_settled_sum, 0)).label('settled_without_banking'),
+            'settled_without_banking': monthly['settled_units_with_banking'],
             # Settled with banking = matched_settled_sum + intra_settlement + inter_settlement
-            func.sum(
-                func.coalesce(BankingSettlement.matched_settled_sum, 0) +
-                func.coalesce(BankingSettlement.intra_settlement, 0) +
-                func.coalesce(BankingSettlement.inter_settlement, 0)
-            ).label('settled_with_banking'),
+            'settled_with_banking': (
+                monthly['settled_units_with_banking'] + monthly['intra_settlement'] + monthly['inter_settlement']
+            ),
             # Grid consumption with banking = surplus_demand_sum_after_inter (final demand after banking)
-            func.sum(func.coalesce(BankingSettlement.surplus_demand_sum_after_inter, 0)).label('grid_consumption_with_banking'),
+            'grid_consumption_with_banking': monthly['surplus_demand_after_banking'],
             # Grid consumption without banking = surplus_demand_sum (initial demand before banking)
-            func.sum(func.coalesce(BankingSettlement.surplus_demand_sum, 0)).label('grid_consumption_without_banking')
-        )
+            'grid_consumption_without_banking': monthly['total_consumption']
+        }).reset_index()
         
-        # Apply filters
-        if plant_name != "Combined View":
-            query = query.filter(BankingSettlement.plant_name == plant_name)
-        
-        if client_name:
-            query = query.filter(BankingSettlement.client_name == client_name)
-        
-        # Group by month and order by date
-        query = query.group_by(
-            func.date_format(BankingSettlement.date, '%Y-%m')
-        ).order_by(
-            func.date_format(BankingSettlement.date, '%Y-%m')
-        )
+        df['banking_savings'] = df['settled_without_banking'] - df['settled_with_banking']
+        df['grid_reduction'] = df['grid_consumption_without_banking'] - df['grid_consumption_with_banking']
+        df['total_savings'] = df['banking_savings'] + df['grid_reduction']
         
-        results = query.all()
-        session.close()
-        
-        if not results:
-            logger.warning(f"No banking settlement data found for plant: {plant_name}")
-            return pd.DataFrame()
-        
-        # Convert to DataFrame
-        data = []
-        for result in results:
-            settled_without = float(result.settled_without_banking or 0)
-            settled_with = float(result.settled_with_banking or 0)
-            grid_with = float(result.grid_consumption_with_banking or 0)
-            grid_without = float(result.grid_consumption_without_banking or 0)
-            
-            data.append({
-                'month': result.month,
-                'settled_without_banking': settled_without,
-                'settled_with_banking': settled_with,
-                'grid_consumption_with_banking': grid_with,
-                'grid_consumption_without_banking': grid_without,
-                'banking_savings': settled_without - settled_with,
-                'grid_reduction': grid_without - grid_with,
-                'total_savings': (settled_without - settled_with) + (grid_without - grid_with)
-            })
-        
-        df = pd.DataFrame(data)
         logger.info(f"Retrieved {len(df)} months of energy metrics data for plant: {plant_name}")
         return df
         
     except Exception as e:
         logger.error(f"Failed to get monthly energy metrics data: {e}")
         logger.error(traceback.format_exc())
-        return pd.DataFrame()
+        return _EMPTY_BANKING_METRICS.copy()
@@ -3,10 +3,18 @@ Database-based data manager with optimized performance and error handling.
 This module provides clean, efficient data access with proper validation.
 """
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import traceback
-from functools import wraps
+import threading
+import time
+import random
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps, lru_cache
+
+from sqlalchemy.exc import OperationalError, InterfaceError
 
 # Import optimized functions
 from backend.data.db_data_manager_optimized import (
@@ -15,18 +23,19 @@ from backend.data.db_data_manager_optimized import (
     get_generation_only_data_optimized,
     get_consumption_data_optimized_wrapper,
     get_tod_binned_data_optimized,
+    daily_sum,
     data_manager
 )
 
 # Import original functions for backward compatibility
 from backend.data.db_data import (
     get_generation_data_db,
-    get_consumption_data_db,
+    get_consumption_data_db_multi,
     get_consumption_data_by_client,
     get_settlement_data_db,
     get_plants_from_db,
     get_daily_aggregated_generation_db,
-    get_daily_aggregated_consumption_db,
+    get_daily_aggregated_consumption_db_multi,
     get_tod_aggregated_data_db,
     get_combined_plants_data_db,
     get_plant_id_from_name,
@@ -40,10 +49,8 @@ from backend.data.db_data import (
     get_settlement_combined_client_data,
     get_settlement_tod_aggregated_data
 )
-from backend.data.db_data_clean import (
-    get_monthly_energy_metrics_data_db as get_monthly_energy_metrics_data_clean_db
-)
 from backend.utils.client_mapping import (
+    load_client_mapping,
     get_client_name_from_plant_name,
     get_plant_id_from_plant_name,
     validate_client_plant_mapping
@@ -54,8 +61,18 @@ from backend.config.tod_config import get_tod_slots, get_tod_slot
 # Configure logging
 logger = setup_logger('db_data_manager', 'db_data_manager.log')
 
-def retry_on_exception(max_retries=3, retry_delay=1):
-    """Decorator to retry a function on exception"""
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:  # Older Streamlit; worker threads just run without a script context
+    add_script_run_ctx = get_script_run_ctx = None
+
+def retry_on_exception(max_retries=3, retry_delay=1, max_delay=8, retryable_exceptions=(OperationalError, InterfaceError)):
+    """
+    Decorator to retry a function on transient database errors.
+    
+    Only retryable_exceptions (connection-level failures by default) are retried,
+    with exponential backoff and jitter; any other exception is raised immediately.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -63,17 +80,36 @@ def retry_on_exception(max_retries=3, retry_delay=1):
             for attempt in range(max_retries):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except retryable_exceptions as e:
+                    # Already retried by a nested decorated loader; don't multiply the attempts
+                    if getattr(e, 'retries_exhausted', False):
+                        raise
                     last_exception = e
                     logger.warning(f"Attempt {attempt+1}/{max_retries} failed: {e}")
                     if attempt < max_retries - 1:
-                        import time
-                        time.sleep(retry_delay)
+                        delay = min(max_delay, retry_delay * 2 ** attempt)
+                        time.sleep(delay + random.uniform(0, delay / 2))
             logger.error(f"Function {func.__name__} failed after {max_retries} attempts")
+            last_exception.retries_exhausted = True
             raise last_exception
         return wrapper
     return decorator
 
+@lru_cache(maxsize=1024)
+def _iso_date(value):
+    """
+    Format a date as the YYYY-MM-DD string the data layer expects, memoized per date.
+    
+    Args:
+        value: date, datetime or pandas Timestamp (only the date part is kept)
+        
+    Returns:
+        ISO date string
+    """
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.isoformat()
+
 # Plant management functions - using optimized version
 def get_plants():
     """
@@ -105,6 +141,27 @@ def get_plant_display_name(plant_obj):
     else:
         return str(plant_obj)
 
+# Plant IDs in the client mapping, kept once a load returns any; an empty or failed load is retried
+_known_plant_id_set = set()
+
+def _known_plant_ids():
+    """
+    Get every plant ID in the client mapping, read once it loads successfully.
+    
+    Returns:
+        Set of plant IDs
+    """
+    if not _known_plant_id_set:
+        client_data = load_client_mapping()
+        _known_plant_id_set.update(
+            plant.get('plant_id')
+            for energy_type in ('solar', 'wind')
+            for plants in client_data.get(energy_type, {}).values()
+            for plant in plants
+            if plant.get('plant_id')
+        )
+    return _known_plant_id_set
+
 def get_plant_id(plant_name):
     """
     Get plant ID from plant name using optimized method.
@@ -116,11 +173,36 @@ def get_plant_id(plant_name):
         Plant ID if found, None otherwise
     """
     try:
+        # Callers that already resolved the ID skip the name lookup
+        if isinstance(plant_name, str) and plant_name in _known_plant_ids():
+            return plant_name
         return data_manager.get_plant_id(plant_name)
     except Exception as e:
         logger.error(f"Failed to get plant ID for {plant_name}: {e}")
         return None
 
+# Plant name -> 'solar'/'wind', rebuilt only when get_plants() hands back a refreshed plants dict
+_plant_type_index = {'plants': None, 'types': {}}
+
+def _get_plant_type_index():
+    """
+    Get the plant type of every plant by name, built once per plants refresh.
+    
+    Returns:
+        Dictionary of plant name to 'solar' or 'wind'
+    """
+    plants = get_plants()
+    if plants is not _plant_type_index['plants']:
+        types = {}
+        for client_plants in plants.values():
+            # Solar last, so a name listed under both types counts as solar
+            for plant_type in ('wind', 'solar'):
+                for plant in client_plants.get(plant_type, []):
+                    types[plant.get('name')] = plant_type
+        _plant_type_index['types'] = types
+        _plant_type_index['plants'] = plants
+    return _plant_type_index['types']
+
 def is_solar_plant(plant_name):
     """
     Check if a plant is a solar plant.
@@ -138,16 +220,65 @@ def is_solar_plant(plant_name):
         else:
             actual_plant_name = plant_name
         
-        plants = get_plants()
-        for client_name, client_plants in plants.items():
-            for plant in client_plants.get('solar', []):
-                if plant.get('name') == actual_plant_name:
-                    return True
-        return False
+        return _get_plant_type_index().get(actual_plant_name) == 'solar'
     except Exception as e:
         logger.error(f"Failed to check if {plant_name} is solar: {e}")
         return False
 
+def prefetch_dashboard_data(client_name, plant_name, start_date, end_date, include_combined=False):
+    """
+    Warm the per-page data caches concurrently before the views render.
+    
+    The views fetch settlement and consumption data one after another; running
+    the independent queries on parallel pooled connections up front lets the
+    views hit the caches, so the page waits for the slowest query, not the sum.
+    Each task uses the same function and arguments as the view that reads it.
+    
+    Args:
+        client_name: Selected client name
+        plant_name: Selected plant name or plant object ("Combined View" skips per-plant data)
+        start_date: Start date
+        end_date: End date
+        include_combined: Whether the combined wind and solar view is shown for the client
+    """
+    try:
+        start_str = _iso_date(start_date)
+        end_str = _iso_date(end_date)
+        
+        tasks = []
+        # Combined wind and solar generation (get_combined_wind_solar_generation)
+        if client_name and include_combined:
+            tasks.append((get_settlement_combined_client_data, (client_name, start_str, end_str)))
+        
+        # Consumption views look the client up from the plant (get_consumption_data_db_clean)
+        consumption_client = get_client_name_from_plant_name(plant_name)
+        if consumption_client:
+            tasks.append((get_consumption_data_by_client, (consumption_client, start_str, end_str)))
+        
+        # Power cost analysis (calculate_power_cost_metrics)
+        if plant_name and plant_name != "Combined View":
+            plant_id = get_plant_id(plant_name)
+            if plant_id:
+                tasks.append((get_settlement_data_db, (plant_id, start_str, end_str)))
+        
+        if not tasks:
+            return
+        
+        # Worker threads share the Streamlit script context so cache access stays attached to the session
+        ctx = get_script_run_ctx() if get_script_run_ctx else None
+        
+        def attach_context():
+            if ctx is not None:
+                add_script_run_ctx(threading.current_thread(), ctx)
+        
+        with ThreadPoolExecutor(max_workers=len(tasks), initializer=attach_context) as pool:
+            futures = [pool.submit(fetch, *args) for fetch, args in tasks]
+            for future in futures:
+                future.result()
+        
+    except Exception as e:
+        logger.error(f"Failed to prefetch dashboard data: {e}")
+
 # Generation data functions - using optimized versions
 def get_generation_consumption_comparison(plant_name, date):
     """
@@ -242,30 +373,16 @@ def get_daily_consumption_data(plant_name, start_date, end_date):
             logger.warning(f"Could not find plant_id for {plant_name}")
             return pd.DataFrame()
         
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = end_date.strftime('%Y-%m-%d')
-        
-        # Get plant type for filtering
-        plant_type = None
-        if is_solar_plant(plant_name):
-            plant_type = 'solar'
-        else:
-            # Assume wind if not solar
-            plant_type = 'wind'
+        start_str = _iso_date(start_date)
+        end_str = _iso_date(end_date)
         
-        # Use new SettlementData computed datetime approach
-        settlement_df = get_settlement_consumption_data(plant_id, start_str, end_str, plant_type)
+        # Use new SettlementData computed datetime approach; the settlement layer filters by the plant's own type
+        settlement_df = get_settlement_consumption_data(plant_id, start_str, end_str)
         
         if not settlement_df.empty:
             # Aggregate consumption data by date
-            settlement_df['date'] = settlement_df['datetime'].dt.date
-            daily_df = settlement_df.groupby('date').agg({
-                'total_consumption': 'sum'
-            }).reset_index()
-            
-            # Convert date to datetime for consistency
-            daily_df['date'] = pd.to_datetime(daily_df['date'])
-            daily_df = daily_df.rename(columns={'date': 'time', 'total_consumption': 'Consumption'})
+            days, sums = daily_sum(settlement_df['datetime'], settlement_df['total_consumption'])
+            daily_df = pd.DataFrame({'time': days, 'Consumption': sums})
             
             logger.info(f"Retrieved daily consumption data using new SettlementData approach for {plant_name} from {start_str} to {end_str}")
             return daily_df
@@ -278,20 +395,8 @@ def get_daily_consumption_data(plant_name, start_date, end_date):
                 logger.warning(f"Could not find any consumption units for {plant_name}")
                 return pd.DataFrame()
             
-            # Get consumption data for all units and combine
-            all_consumption_dfs = []
-            for cons_unit in cons_units:
-                unit_df = get_daily_aggregated_consumption_db(cons_unit, start_str, end_str)
-                if not unit_df.empty:
-                    all_consumption_dfs.append(unit_df)
-            
-            if all_consumption_dfs:
-                # Combine all consumption dataframes
-                consumption_df = pd.concat(all_consumption_dfs)
-                # Aggregate by date to sum consumption across all units
-                consumption_df = consumption_df.groupby('date')['consumption_kwh'].sum().reset_index()
-            else:
-                consumption_df = pd.DataFrame(columns=['date', 'consumption_kwh'])
+            # Daily consumption summed across all units in one query
+            consumption_df = get_daily_aggregated_consumption_db_multi(cons_units, start_str, end_str)
             
             if not consumption_df.empty:
                 consumption_df = consumption_df.rename(columns={'date': 'time', 'consumption': 'Consumption'})
@@ -299,6 +404,8 @@ def get_daily_consumption_data(plant_name, start_date, end_date):
             logger.info(f"Retrieved daily consumption data from consumption table for {plant_name} from {start_str} to {end_str}")
             return consumption_df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get daily consumption data: {e}")
         logger.error(traceback.format_exc())
@@ -321,48 +428,29 @@ def get_combined_wind_solar_generation(client_name, start_date, end_date):
         DataFrame with combined generation data
     """
     try:
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = end_date.strftime('%Y-%m-%d')
+        start_str = _iso_date(start_date)
+        end_str = _iso_date(end_date)
         
         # Use new SettlementData computed datetime approach
         combined_df = get_settlement_combined_client_data(client_name, start_str, end_str)
         
         if not combined_df.empty:
-            # Check if single day or multi-day
+            # Single day keeps the interval timestamps, multi-day aggregates by date
             if start_date == end_date:
-                # Single day - use datetime
-                time_col = 'datetime'
+                time_key = combined_df['datetime']
             else:
-                # Multi-day - aggregate by date
-                combined_df['date'] = combined_df['datetime'].dt.date
-                combined_df = combined_df.groupby(['date', 'type']).agg({
-                    'total_generation': 'sum'
-                }).reset_index()
-                combined_df['date'] = pd.to_datetime(combined_df['date'])
-                time_col = 'date'
-            
-            # Pivot to get separate columns for solar and wind
-            pivot_df = combined_df.pivot_table(
-                index=time_col, 
-                columns='type', 
-                values='total_generation', 
-                fill_value=0
-            ).reset_index()
-            
-            # Rename columns
-            column_mapping = {time_col: 'time'}
-            if 'solar' in pivot_df.columns:
-                column_mapping['solar'] = 'Solar Generation'
-            if 'wind' in pivot_df.columns:
-                column_mapping['wind'] = 'Wind Generation'
+                time_key = combined_df['datetime'].dt.floor('D')
             
-            pivot_df = pivot_df.rename(columns=column_mapping)
-            
-            # Ensure both columns exist
-            if 'Solar Generation' not in pivot_df.columns:
-                pivot_df['Solar Generation'] = 0
-            if 'Wind Generation' not in pivot_df.columns:
-                pivot_df['Wind Generation'] = 0
+            # Split generation into solar and wind columns with masks instead of a pivot,
+            # so both columns always exist (type is categorical, so the masks compare codes)
+            generation = combined_df['total_generation'].to_numpy(dtype='float64', na_value=0.0)
+            is_solar = (combined_df['type'] == 'solar').to_numpy()
+            is_wind = (combined_df['type'] == 'wind').to_numpy()
+            pivot_df = pd.DataFrame({
+                'time': time_key,
+                'Solar Generation': np.where(is_solar, generation, 0.0),
+                'Wind Generation': np.where(is_wind, generation, 0.0)
+            }).groupby('time')[['Solar Generation', 'Wind Generation']].sum().reset_index()
             
             logger.info(f"Retrieved combined wind-solar data using new SettlementData approach for {client_name} from {start_str} to {end_str}")
             return pivot_df
@@ -387,14 +475,12 @@ def get_combined_wind_solar_generation(client_name, start_date, end_date):
             else:
                 # Multi-day - aggregate by date
                 if not solar_df.empty:
-                    solar_df['date'] = solar_df['datetime'].dt.date
+                    solar_df['date'] = solar_df['datetime'].dt.floor('D')
                     solar_df = solar_df.groupby('date')['generation'].sum().reset_index()
-                    solar_df['date'] = pd.to_datetime(solar_df['date'])
                 
                 if not wind_df.empty:
-                    wind_df['date'] = wind_df['datetime'].dt.date
+                    wind_df['date'] = wind_df['datetime'].dt.floor('D')
                     wind_df = wind_df.groupby('date')['generation'].sum().reset_index()
-                    wind_df['date'] = pd.to_datetime(wind_df['date'])
                 
                 time_col = 'date'
             
@@ -408,19 +494,19 @@ def get_combined_wind_solar_generation(client_name, start_date, end_date):
                     time_col: 'time'
                 })
             elif not solar_df.empty:
-                merged_df = solar_df.copy()
+                merged_df = solar_df.rename(columns={'generation': 'Solar Generation', time_col: 'time'})
                 merged_df['Wind Generation'] = 0
-                merged_df = merged_df.rename(columns={'generation': 'Solar Generation', time_col: 'time'})
             elif not wind_df.empty:
-                merged_df = wind_df.copy()
+                merged_df = wind_df.rename(columns={'generation': 'Wind Generation', time_col: 'time'})
                 merged_df['Solar Generation'] = 0
-                merged_df = merged_df.rename(columns={'generation': 'Wind Generation', time_col: 'time'})
             else:
                 return pd.DataFrame()
             
             logger.info(f"Retrieved combined wind-solar data from separate tables for {client_name} from {start_str} to {end_str}")
             return merged_df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get combined wind-solar data: {e}")
         logger.error(traceback.format_exc())
@@ -467,12 +553,15 @@ def calculate_power_cost_metrics(plant_name, start_date, end_date, grid_rate_per
             logger.warning(f"Could not find plant_id for {plant_name}")
             return pd.DataFrame()
         
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = end_date.strftime('%Y-%m-%d')
+        start_str = _iso_date(start_date)
+        end_str = _iso_date(end_date)
         
         # Try to get settlement data first
         settlement_df = get_settlement_data_db(plant_id, start_str, end_str)
         
+        # Settlement energy is cached as float32; cost and savings totals are computed in float64
+        settlement_df = settlement_df.astype({col: 'float64' for col in settlement_df.select_dtypes('float32').columns})
+        
         # Add surplus column for backward compatibility if it doesn't exist
         if not settlement_df.empty and 'surplus' not in settlement_df.columns:
             settlement_df['surplus'] = settlement_df['allocated_generation'] - settlement_df['consumption']
@@ -486,22 +575,8 @@ def calculate_power_cost_metrics(plant_name, start_date, end_date, grid_rate_per
             # Get consumption unit for the plant
             cons_units = get_consumption_unit_from_plant(plant_name)
             if cons_units:
-                # Get consumption data for all units and combine
-                all_consumption_dfs = []
-                for cons_unit in cons_units:
-                    unit_df = get_consumption_data_db(cons_unit, start_str, end_str)
-                    if not unit_df.empty:
-                        all_consumption_dfs.append(unit_df)
-                
-                if all_consumption_dfs:
-                    # Combine all consumption data
-                    consumption_df = pd.concat(all_consumption_dfs, ignore_index=True)
-                    # Group by datetime and sum consumption values
-                    consumption_df = consumption_df.groupby('datetime').agg({
-                        'consumption': 'sum'
-                    }).reset_index()
-                else:
-                    consumption_df = pd.DataFrame()
+                # Consumption summed across all units per interval in one query
+                consumption_df = get_consumption_data_db_multi(cons_units, start_str, end_str)
             else:
                 consumption_df = pd.DataFrame()
             
@@ -570,6 +645,8 @@ def calculate_power_cost_metrics(plant_name, start_date, end_date, grid_rate_per
         logger.info(f"Calculated power cost metrics for {plant_name} from {start_str} to {end_str}")
         return settlement_df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to calculate power cost metrics: {e}")
         logger.error(traceback.format_exc())
@@ -718,8 +795,8 @@ def get_settlement_data_by_timeframe(plant_name, start_date, end_date=None):
             logger.warning(f"Could not find plant_id for {plant_name}")
             return pd.DataFrame()
         
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = end_date.strftime('%Y-%m-%d')
+        start_str = _iso_date(start_date)
+        end_str = _iso_date(end_date)
         
         # Get data directly from settlement_data table
         settlement_df = get_settlement_data_db(plant_id, start_str, end_str)
@@ -742,6 +819,8 @@ def get_settlement_data_by_timeframe(plant_name, start_date, end_date=None):
         logger.info(f"Retrieved settlement data for {plant_name} from {start_str} to {end_str}")
         return settlement_df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get settlement data: {e}")
         logger.error(traceback.format_exc())
@@ -809,8 +888,8 @@ def get_consumption_data_db_clean(plant_name, start_date, end_date=None):
             end_date = start_date
         
         # Convert dates to string format
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = end_date.strftime('%Y-%m-%d')
+        start_str = _iso_date(start_date)
+        end_str = _iso_date(end_date)
         
         # Get client name from plant name
         client_name = get_client_name_from_plant_name(plant_name)
@@ -828,6 +907,8 @@ def get_consumption_data_db_clean(plant_name, start_date, end_date=None):
         logger.info(f"Retrieved {len(consumption_df)} consumption records for plant {plant_name}")
         return consumption_df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get consumption data for {plant_name}: {e}")
         logger.error(traceback.format_exc())
@@ -850,8 +931,8 @@ def get_daily_consumption_data_db_clean(plant_name, start_date, end_date):
     """
     try:
         # Convert dates to string format
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = end_date.strftime('%Y-%m-%d')
+        start_str = _iso_date(start_date)
+        end_str = _iso_date(end_date)
         
         # Get client name from plant name
         client_name = get_client_name_from_plant_name(plant_name)
@@ -869,6 +950,8 @@ def get_daily_consumption_data_db_clean(plant_name, start_date, end_date):
         logger.info(f"Retrieved {len(consumption_df)} consumption records for plant {plant_name} from {start_str} to {end_str}")
         return consumption_df
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get daily consumption data for {plant_name}: {e}")
         logger.error(traceback.format_exc())
@@ -915,6 +998,8 @@ def get_monthly_before_banking_settlement_data(plant_name: str) -> pd.DataFrame:
         client_name = get_client_name_from_plant_name(plant_name)
         return get_monthly_before_banking_settlement_data_db(plant_name, client_name)
         
+    except (OperationalError, InterfaceError):
+        raise
     except Exception as e:
         logger.error(f"Failed to get monthly banking settlement data for {plant_name}: {e}")
         logger.error(traceback.format_exc())
@@ -933,7 +1018,7 @@ def get_monthly_energy_metrics_data(plant_name: str) -> pd.DataFrame:
     """
     try:
         client_name = get_client_name_from_plant_name(plant_name)
-        return get_monthly_energy_metrics_data_clean_db(plant_name, client_name)
+        return get_monthly_energy_metrics_data_db(plant_name, client_name)
         
     except Exception as e:
         logger.error(f"Failed to get monthly energy metrics data for {plant_name}: {e}")
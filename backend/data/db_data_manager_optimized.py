@@ -3,6 +3,7 @@ Optimized database data manager with improved error handling and performance.
 This module provides clean, efficient data access with proper validation.
 """
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import traceback
@@ -34,6 +35,22 @@ from backend.config.tod_config import get_tod_slots
 # Configure logging
 logger = setup_logger('db_data_manager_optimized', 'db_data_manager.log')
 
+def daily_sum(datetimes, values):
+    """
+    Sum one column per calendar day with NumPy instead of a pandas groupby.
+    
+    Args:
+        datetimes: datetime64 Series of interval timestamps
+        values: Numeric Series aligned with datetimes (NaN counts as 0)
+        
+    Returns:
+        Tuple of (days as a datetime64[ns] array, float64 sums), sorted by day
+    """
+    days = datetimes.to_numpy().astype('datetime64[D]')
+    uniques, codes = np.unique(days, return_inverse=True)
+    sums = np.bincount(codes, weights=values.to_numpy(dtype='float64', na_value=0.0), minlength=len(uniques))
+    return uniques.astype('datetime64[ns]'), sums
+
 def smart_cache_and_retry(ttl=3600, max_retries=2):
     """Combined caching and retry decorator with optimized parameters"""
     def decorator(func):
@@ -133,7 +150,7 @@ class OptimizedDataManager:
                 availability = checker.check_data_availability(plant_id, start_str, end_str)
                 
                 if availability.get('future_date', False):
-                    rec_start, rec_end = get_recommended_date_range(plant_id)
+                    rec_start, rec_end = get_recommended_date_range(plant_id, checker)
                     if rec_start and rec_end:
                         return False, f"Requested dates are in the future. Try: {rec_start} to {rec_end}"
                     else:
@@ -171,11 +188,9 @@ def get_generation_consumption_comparison_optimized(plant_name, date):
         
         if not settlement_df.empty:
             # Use settlement data
-            generation_df = settlement_df[['datetime', 'allocated_generation']].copy()
-            generation_df = generation_df.rename(columns={'datetime': 'time', 'allocated_generation': 'Generation'})
-            
-            consumption_df = settlement_df[['datetime', 'consumption']].copy()
-            consumption_df = consumption_df.rename(columns={'datetime': 'time', 'consumption': 'Consumption'})
+            # Build each renamed frame in one step instead of a projection copy plus a rename copy
+            generation_df = pd.DataFrame({'time': settlement_df['datetime'], 'Generation': settlement_df['allocated_generation']})
+            consumption_df = pd.DataFrame({'time': settlement_df['datetime'], 'Consumption': settlement_df['consumption']})
             
             logger.info(f"Retrieved comparison data from settlement table for {plant_name}")
             return generation_df, consumption_df
@@ -224,13 +239,9 @@ def get_daily_generation_consumption_comparison_optimized(selected_plant, start_
         
         if not settlement_df.empty:
             # Aggregate by date
-            settlement_df['date'] = settlement_df['datetime'].dt.date
-            daily_df = settlement_df.groupby('date').agg({
-                'allocated_generation': 'sum',
-                'consumption': 'sum'
-            }).reset_index()
+            settlement_df['date'] = settlement_df['datetime'].dt.floor('D')
+            daily_df = settlement_df.groupby('date')[['allocated_generation', 'consumption']].sum().reset_index()
             
-            daily_df['date'] = pd.to_datetime(daily_df['date'])
             daily_df = daily_df.rename(columns={
                 'allocated_generation': 'generation_kwh',
                 'consumption': 'consumption_kwh'
@@ -256,18 +267,18 @@ def get_daily_generation_consumption_comparison_optimized(selected_plant, start_
             return pd.DataFrame()
         
         # Aggregate to daily
-        generation_df['date'] = generation_df['datetime'].dt.date
-        consumption_df['date'] = consumption_df['datetime'].dt.date
-        
-        gen_daily = generation_df.groupby('date')['generation'].sum().reset_index()
-        cons_daily = consumption_df.groupby('date')['consumption'].sum().reset_index()
-        
-        # Merge
-        merged_df = pd.merge(gen_daily, cons_daily, on='date', how='outer').fillna(0)
-        merged_df['date'] = pd.to_datetime(merged_df['date'])
-        merged_df = merged_df.rename(columns={
-            'generation': 'generation_kwh',
-            'consumption': 'consumption_kwh'
+        gen_days, gen_sums = daily_sum(generation_df['datetime'], generation_df['generation'])
+        cons_days, cons_sums = daily_sum(consumption_df['datetime'], consumption_df['consumption'])
+        gen_daily = pd.Series(gen_sums, index=gen_days)
+        cons_daily = pd.Series(cons_sums, index=cons_days)
+        
+        # Both day indexes are sorted and unique, so aligning them on their union
+        # replaces the outer merge + fillna
+        days = gen_daily.index.union(cons_daily.index)
+        merged_df = pd.DataFrame({
+            'date': days,
+            'generation_kwh': gen_daily.reindex(days, fill_value=0).to_numpy(),
+            'consumption_kwh': cons_daily.reindex(days, fill_value=0).to_numpy()
         })
         
         return merged_df
@@ -308,10 +319,8 @@ def get_generation_only_data_optimized(plant_name, start_date, end_date=None):
             generation_df['hour'] = generation_df['time'].dt.hour
         else:
             # Multi-day - aggregate by date
-            generation_df['date'] = generation_df['datetime'].dt.date
-            daily_df = generation_df.groupby('date')['generation'].sum().reset_index()
-            daily_df['date'] = pd.to_datetime(daily_df['date'])
-            generation_df = daily_df.rename(columns={'date': 'time', 'generation': 'generation_kwh'})
+            days, sums = daily_sum(generation_df['datetime'], generation_df['generation'])
+            generation_df = pd.DataFrame({'time': days, 'generation_kwh': sums})
         
         logger.info(f"Retrieved generation data for {plant_name}")
         return generation_df
@@ -41,7 +41,7 @@ def smart_retry_on_exception(max_retries=2, retry_delay=0.5):
     return decorator
 
 def get_db_session():
-    """Get database session with connection pooling"""
+    """Get database session with connection pooling; use as a context manager so it is closed on every path"""
     return SessionLocal()
 
 @st.cache_data(ttl=3600)
@@ -74,25 +74,23 @@ def get_generation_data_optimized(plant_id: str, start_date: str, end_date: str)
                 return pd.DataFrame(columns=['datetime', 'generation'])
         
         # Proceed with optimized query
-        session = get_db_session()
-        
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Optimized query with proper indexing
-        query = session.query(
-            TblGeneration.datetime,
-            TblGeneration.generation
-        ).filter(
-            and_(
-                TblGeneration.plant_id == plant_id,
-                TblGeneration.date >= start_dt,
-                TblGeneration.date <= end_dt
-            )
-        ).order_by(TblGeneration.datetime)
-        
-        result = query.all()
-        session.close()
+        with get_db_session() as session:
+            # Optimized query with proper indexing
+            query = session.query(
+                TblGeneration.datetime,
+                TblGeneration.generation
+            ).filter(
+                and_(
+                    TblGeneration.plant_id == plant_id,
+                    TblGeneration.date >= start_dt,
+                    TblGeneration.date <= end_dt
+                )
+            ).order_by(TblGeneration.datetime)
+            
+            result = query.all()
         
         if not result:
             return pd.DataFrame(columns=['datetime', 'generation'])
@@ -121,41 +119,38 @@ def get_consumption_data_optimized(client_name: str, start_date: str, end_date:
             logger.error(f"Invalid date range for client {client_name}: {error_msg}")
             return pd.DataFrame(columns=['datetime', 'consumption'])
         
-        session = get_db_session()
-        
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Check if data exists before querying
-        count_query = session.query(func.count(TblConsumption.id)).filter(
-            and_(
-                TblConsumption.client_name == client_name,
-                TblConsumption.date >= start_dt,
-                TblConsumption.date <= end_dt
-            )
-        )
-        
-        record_count = count_query.scalar()
-        
-        if record_count == 0:
-            session.close()
-            logger.info(f"No consumption data available for client {client_name} from {start_date} to {end_date}")
-            return pd.DataFrame(columns=['datetime', 'consumption'])
-        
-        # Proceed with data query
-        query = session.query(
-            TblConsumption.datetime,
-            TblConsumption.consumption
-        ).filter(
-            and_(
-                TblConsumption.client_name == client_name,
-                TblConsumption.date >= start_dt,
-                TblConsumption.date <= end_dt
+        with get_db_session() as session:
+            # Check if data exists before querying
+            count_query = session.query(func.count(TblConsumption.id)).filter(
+                and_(
+                    TblConsumption.client_name == client_name,
+                    TblConsumption.date >= start_dt,
+                    TblConsumption.date <= end_dt
+                )
             )
-        ).order_by(TblConsumption.datetime)
-        
-        result = query.all()
-        session.close()
+            
+            record_count = count_query.scalar()
+            
+            if record_count == 0:
+                logger.info(f"No consumption data available for client {client_name} from {start_date} to {end_date}")
+                return pd.DataFrame(columns=['datetime', 'consumption'])
+            
+            # Proceed with data query
+            query = session.query(
+                TblConsumption.datetime,
+                TblConsumption.consumption
+            ).filter(
+                and_(
+                    TblConsumption.client_name == client_name,
+                    TblConsumption.date >= start_dt,
+                    TblConsumption.date <= end_dt
+                )
+            ).order_by(TblConsumption.datetime)
+            
+            result = query.all()
         
         df = pd.DataFrame(result, columns=['datetime', 'consumption'])
         df['datetime'] = pd.to_datetime(df['datetime'])
@@ -193,33 +188,31 @@ def get_settlement_data_optimized(plant_id: str, start_date: str, end_date: str)
                 logger.info(f"No settlement data available for plant {plant_id} from {start_date} to {end_date}")
                 return pd.DataFrame(columns=['datetime', 'cons_unit', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled', 'slot_name', 'slot_time'])
         
-        session = get_db_session()
-        
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Optimized settlement query
-        query = session.query(
-            SettlementData.datetime,
-            SettlementData.cons_unit,
-            SettlementData.allocated_generation,
-            SettlementData.consumption,
-            SettlementData.deficit,
-            SettlementData.surplus_demand,
-            SettlementData.surplus_generation,
-            SettlementData.settled,
-            SettlementData.slot_name,
-            SettlementData.slot_time
-        ).filter(
-            and_(
-                SettlementData.plant_id == plant_id,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
-            )
-        ).order_by(SettlementData.datetime, SettlementData.cons_unit)
-        
-        result = query.all()
-        session.close()
+        with get_db_session() as session:
+            # Optimized settlement query
+            query = session.query(
+                SettlementData.datetime,
+                SettlementData.cons_unit,
+                SettlementData.allocated_generation,
+                SettlementData.consumption,
+                SettlementData.deficit,
+                SettlementData.surplus_demand,
+                SettlementData.surplus_generation,
+                SettlementData.settled,
+                SettlementData.slot_name,
+                SettlementData.slot_time
+            ).filter(
+                and_(
+                    SettlementData.plant_id == plant_id,
+                    SettlementData.date >= start_dt,
+                    SettlementData.date <= end_dt
+                )
+            ).order_by(SettlementData.datetime, SettlementData.cons_unit)
+            
+            result = query.all()
         
         df = pd.DataFrame(result, columns=['datetime', 'cons_unit', 'allocated_generation', 'consumption', 'deficit', 'surplus_demand', 'surplus_generation', 'settled', 'slot_name', 'slot_time'])
         df['datetime'] = pd.to_datetime(df['datetime'])
@@ -261,67 +254,65 @@ def get_settlement_tod_data_optimized(plant_id: str, start_date: str, end_date:
                 logger.info(f"No settlement data available for ToD analysis: plant {plant_id} from {start_date} to {end_date}")
                 return pd.DataFrame()
         
-        session = get_db_session()
-        
         start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Create computed datetime using func.timestamp
-        computed_datetime = func.timestamp(SettlementData.date, SettlementData.time)
-        
-        # Get ToD slots configuration
-        tod_slots = get_tod_slots()
-        
-        # Create CASE statement for ToD bin assignment
-        tod_case_conditions = []
-        for slot_name, slot_info in tod_slots.items():
-            start_hour = slot_info['start_hour']
-            end_hour = slot_info['end_hour']
+        with get_db_session() as session:
+            # Create computed datetime using func.timestamp
+            computed_datetime = func.timestamp(SettlementData.date, SettlementData.time)
             
-            if start_hour <= end_hour:
-                condition = and_(
-                    func.hour(computed_datetime) >= start_hour,
-                    func.hour(computed_datetime) < end_hour
-                )
-            else:
-                condition = or_(
-                    func.hour(computed_datetime) >= start_hour,
-                    func.hour(computed_datetime) < end_hour
-                )
+            # Get ToD slots configuration
+            tod_slots = get_tod_slots()
+            
+            # Create CASE statement for ToD bin assignment
+            tod_case_conditions = []
+            for slot_name, slot_info in tod_slots.items():
+                start_hour = slot_info['start_hour']
+                end_hour = slot_info['end_hour']
+                
+                if start_hour <= end_hour:
+                    condition = and_(
+                        func.hour(computed_datetime) >= start_hour,
+                        func.hour(computed_datetime) < end_hour
+                    )
+                else:
+                    condition = or_(
+                        func.hour(computed_datetime) >= start_hour,
+                        func.hour(computed_datetime) < end_hour
+                    )
+                
+                tod_case_conditions.append((condition, slot_name))
+            
+            tod_bin_case = case(*tod_case_conditions, else_='Unknown')
             
-            tod_case_conditions.append((condition, slot_name))
-        
-        tod_bin_case = case(*tod_case_conditions, else_='Unknown')
-        
-        # Build optimized query
-        query = session.query(
-            SettlementData.plant_id,
-            SettlementData.type,
-            tod_bin_case.label('tod_bin'),
-            func.sum(SettlementData.allocated_generation).label('total_generation'),
-            func.sum(SettlementData.consumption).label('total_consumption'),
-            func.sum(SettlementData.deficit).label('total_deficit'),
-            func.sum(SettlementData.surplus_demand).label('total_surplus_demand'),
-            func.count().label('interval_count')
-        ).filter(
-            and_(
-                SettlementData.plant_id == plant_id,
-                SettlementData.date >= start_dt,
-                SettlementData.date <= end_dt
+            # Build optimized query
+            query = session.query(
+                SettlementData.plant_id,
+                SettlementData.type,
+                tod_bin_case.label('tod_bin'),
+                func.sum(SettlementData.allocated_generation).label('total_generation'),
+                func.sum(SettlementData.consumption).label('total_consumption'),
+                func.sum(SettlementData.deficit).label('total_deficit'),
+                func.sum(SettlementData.surplus_demand).label('total_surplus_demand'),
+                func.count().label('interval_count')
+            ).filter(
+                and_(
+                    SettlementData.plant_id == plant_id,
+                    SettlementData.date >= start_dt,
+                    SettlementData.date <= end_dt
+                )
             )
-        )
-        
-        if plant_type:
-            query = query.filter(SettlementData.type == plant_type)
-        
-        query = query.group_by(
-            SettlementData.plant_id, 
-            SettlementData.type, 
-            tod_bin_case
-        ).order_by(tod_bin_case)
-        
-        result = query.all()
-        session.close()
+            
+            if plant_type:
+                query = query.filter(SettlementData.type == plant_type)
+            
+            query = query.group_by(
+                SettlementData.plant_id, 
+                SettlementData.type, 
+                tod_bin_case
+            ).order_by(tod_bin_case)
+            
+            result = query.all()
         
         if not result:
             return pd.DataFrame()
@@ -366,17 +357,15 @@ def get_plants_optimized() -> Dict:
     Optimized plants retrieval with caching and error handling.
     """
     try:
-        session = get_db_session()
-        
-        # Single query to get all plants
-        plants_query = session.query(
-            TblPlants.plant_id,
-            TblPlants.plant_name,
-            TblPlants.client_name,
-            TblPlants.type
-        ).all()
-        
-        session.close()
+        with get_db_session() as session:
+            # Single query to get all plants
+            plants_query = session.query(
+                TblPlants.plant_id,
+                TblPlants.plant_name,
+                TblPlants.client_name,
+                TblPlants.type
+            ).all()
+            
         
         if not plants_query:
             logger.warning("No plants found in database")
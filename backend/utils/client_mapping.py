@@ -88,9 +88,13 @@ def get_plant_info_from_client_name(client_name: str) -> List[Dict]:
         logger.error(f"Error finding plants for client '{client_name}': {e}")
         return []
 
+# Plant name -> plant ID for plants found so far; misses are not stored so a later client.json edit is picked up
+_plant_ids_by_name: Dict[str, str] = {}
+
 def get_plant_id_from_plant_name(plant_name: str) -> Optional[str]:
     """
     Get plant ID from plant name using client.json mapping.
+    Found plant IDs are memoized per plant name, so client.json is not re-read on every lookup.
     
     Args:
         plant_name: Name of the plant
@@ -99,6 +103,9 @@ def get_plant_id_from_plant_name(plant_name: str) -> Optional[str]:
         Plant ID if found, None otherwise
     """
     try:
+        if isinstance(plant_name, str) and plant_name in _plant_ids_by_name:
+            return _plant_ids_by_name[plant_name]
+        
         client_data = load_client_mapping()
         
         # Search through both solar and wind sections
@@ -109,6 +116,8 @@ def get_plant_id_from_plant_name(plant_name: str) -> Optional[str]:
                         if plant.get('name') == plant_name:
                             plant_id = plant.get('plant_id')
                             logger.info(f"Found plant_id '{plant_id}' for plant '{plant_name}'")
+                            if plant_id and isinstance(plant_name, str):
+                                _plant_ids_by_name[plant_name] = plant_id
                             return plant_id
         
         logger.warning(f"No plant_id found for plant '{plant_name}'")
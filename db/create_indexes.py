@@ -0,0 +1,57 @@
+"""
+Script to add the secondary indexes used by the dashboard read paths to an existing database
+"""
+from sqlalchemy import text
+from db_setup import session
+from refresh_generation_daily import CREATE_TABLE_SQL
+
+# (table, index name, column list)
+INDEXES = [
+    ("tbl_consumption", "ix_tblcons_client_date", "client_name, date"),
+    ("settlement_data", "ix_settle_plant_date_unit", "plant_id, date, cons_unit"),
+    ("settlement_data", "ix_settle_plant_datetime_unit", "plant_id, datetime, cons_unit"),
+    ("settlement_data", "ix_settle_client_datetime", "client_name, datetime"),
+    ("settlement_data", "ix_settle_plant_date_type", "plant_id, date, type"),
+    ("settlement_data", "ix_settle_client_date_type", "client_name, date, type"),
+    ("settlement_data", "ix_settle_plant_unit", "plant_id, cons_unit"),
+    ("banking_settlement", "ix_banking_client_plant_date_slot", "client_name, plant_name, date, slot_name, slot_time"),
+    ("banking_settlement", "ix_banking_plant_date_slot", "plant_name, date, slot_name, slot_time"),
+]
+
+def create_indexes():
+    """Create any missing rollup table and indexes without touching existing data"""
+
+    try:
+        # Tables added after the initial schema, created in place without dropping anything
+        session.execute(CREATE_TABLE_SQL)
+        print("Ensured table exists: tbl_generation_daily")
+
+        for table_name, index_name, columns in INDEXES:
+            exists = session.execute(
+                text(
+                    "SELECT COUNT(*) FROM information_schema.statistics "
+                    "WHERE table_schema = DATABASE() AND table_name = :table_name AND index_name = :index_name"
+                ),
+                {"table_name": table_name, "index_name": index_name}
+            ).scalar()
+
+            if exists:
+                print(f"Index already exists: {table_name}.{index_name}")
+                continue
+
+            session.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({columns})"))
+            print(f"Created index: {table_name}.{index_name} ({columns})")
+
+        session.commit()
+        print("Indexes created successfully!")
+
+    except Exception as e:
+        session.rollback()
+        print(f"Error creating indexes: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    create_indexes()
@@ -12,6 +12,7 @@ def create_tables():
         "DROP TABLE IF EXISTS settlement_data",
         "DROP TABLE IF EXISTS consumption_mapping", 
         "DROP TABLE IF EXISTS tbl_consumption",
+        "DROP TABLE IF EXISTS tbl_generation_daily",
         "DROP TABLE IF EXISTS tbl_generation",
         "DROP TABLE IF EXISTS tbl_plants",
         "DROP TABLE IF EXISTS generation_data",
@@ -42,6 +43,13 @@ def create_tables():
             UNIQUE KEY uq_gen (plant_id, date, time, type)
         )""",
         
+        """CREATE TABLE IF NOT EXISTS tbl_generation_daily (
+            plant_id VARCHAR(50) NOT NULL,
+            date DATE NOT NULL,
+            generation DECIMAL(14, 2),
+            PRIMARY KEY (plant_id, date)
+        )""",
+        
         """CREATE TABLE IF NOT EXISTS tbl_consumption (
             id INT AUTO_INCREMENT PRIMARY KEY,
             cons_unit VARCHAR(100) NOT NULL,
@@ -50,7 +58,8 @@ def create_tables():
             time TIME NOT NULL,
             datetime DATETIME GENERATED ALWAYS AS (TIMESTAMP(date, time)) STORED,
             consumption DECIMAL(10, 2),
-            UNIQUE KEY uq_cons (cons_unit, date, time)
+            UNIQUE KEY uq_cons (cons_unit, date, time),
+            INDEX ix_tblcons_client_date (client_name, date)
         )""",
         
         """CREATE TABLE IF NOT EXISTS consumption_mapping (
@@ -75,7 +84,13 @@ def create_tables():
             consumption DECIMAL(10, 2),
             surplus_demand DECIMAL(10, 2),
             surplus_deficit DECIMAL(10, 2),
-            UNIQUE KEY uq_settle (plant_id, date, time, type)
+            UNIQUE KEY uq_settle (plant_id, date, time, type),
+            INDEX ix_settle_plant_date_unit (plant_id, date, cons_unit),
+            INDEX ix_settle_plant_datetime_unit (plant_id, datetime, cons_unit),
+            INDEX ix_settle_client_datetime (client_name, datetime),
+            INDEX ix_settle_plant_date_type (plant_id, date, type),
+            INDEX ix_settle_client_date_type (client_name, date, type),
+            INDEX ix_settle_plant_unit (plant_id, cons_unit)
         )"""
     ]
     
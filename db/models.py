@@ -1,7 +1,7 @@
 """
 Database models for the Energy Generation Dashboard.
 """
-from sqlalchemy import create_engine, Column, String, Enum, DateTime, DECIMAL, Integer, Date, Time, text, UniqueConstraint
+from sqlalchemy import create_engine, Column, String, Enum, DateTime, DECIMAL, Integer, Date, Time, text, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -45,8 +45,16 @@ class TblConsumption(Base):
     
     __table_args__ = (
         UniqueConstraint('cons_unit', 'date', 'time', name='uq_cons'),
+        Index('ix_tblcons_client_date', 'client_name', 'date'),
     )
 
+class TblGenerationDaily(Base):
+    """Daily generation rollup of tbl_generation, refreshed by db/refresh_generation_daily.py"""
+    __tablename__ = 'tbl_generation_daily'
+    plant_id = Column(String(50), primary_key=True)
+    date = Column(Date, primary_key=True)
+    generation = Column(DECIMAL(14, 2))
+
 class ConsumptionMapping(Base):
     __tablename__ = 'consumption_mapping'
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -82,6 +90,12 @@ class SettlementData(Base):
     
     __table_args__ = (
         UniqueConstraint('plant_id', 'date', 'time', 'type', name='uq_settle'),
+        Index('ix_settle_plant_date_unit', 'plant_id', 'date', 'cons_unit'),
+        Index('ix_settle_plant_datetime_unit', 'plant_id', 'datetime', 'cons_unit'),
+        Index('ix_settle_client_datetime', 'client_name', 'datetime'),
+        Index('ix_settle_plant_date_type', 'plant_id', 'date', 'type'),
+        Index('ix_settle_client_date_type', 'client_name', 'date', 'type'),
+        Index('ix_settle_plant_unit', 'plant_id', 'cons_unit'),
     )
 
 
@@ -116,4 +130,6 @@ class BankingSettlement(Base):
 
     __table_args__ = (
         UniqueConstraint('client_name', 'plant_name', 'cons_unit', 'slot_name', 'date', 'type', name='uq_banking_stage'),
+        Index('ix_banking_client_plant_date_slot', 'client_name', 'plant_name', 'date', 'slot_name', 'slot_time'),
+        Index('ix_banking_plant_date_slot', 'plant_name', 'date', 'slot_name', 'slot_time'),
     )
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Script to refresh the tbl_generation_daily rollup from tbl_generation.
+
+Intended to run nightly (e.g. cron: 15 0 * * * python refresh_generation_daily.py),
+which re-rolls the last REFRESH_WINDOW_DAYS completed days, so late or corrected
+tbl_generation rows (and ingest that finished after the run) are picked up on the
+following nights. Pass a start and end date to backfill a range:
+
+    python refresh_generation_daily.py 2024-01-01 2024-06-30
+"""
+import sys
+from datetime import date, datetime, timedelta
+from sqlalchemy import text
+from db_setup import session
+
+# Same definition as db/create_tables.py; lets an existing database gain the rollup without a rebuild
+CREATE_TABLE_SQL = text(
+    "CREATE TABLE IF NOT EXISTS tbl_generation_daily ("
+    "plant_id VARCHAR(50) NOT NULL, "
+    "date DATE NOT NULL, "
+    "generation DECIMAL(14, 2), "
+    "PRIMARY KEY (plant_id, date))"
+)
+
+REFRESH_SQL = text(
+    "INSERT INTO tbl_generation_daily (plant_id, date, generation) "
+    "SELECT plant_id, date, SUM(generation) FROM tbl_generation "
+    "WHERE date >= :start_date AND date <= :end_date "
+    "GROUP BY plant_id, date "
+    "ON DUPLICATE KEY UPDATE generation = VALUES(generation)"
+)
+
+# Days rolled up per transaction, so long backfills never hold one huge write lock
+BATCH_DAYS = 31
+
+# Completed days re-rolled by a default nightly run
+REFRESH_WINDOW_DAYS = 7
+
+def refresh_generation_daily(start_date=None, end_date=None):
+    """Upsert daily generation totals for the given date range (defaults to the last REFRESH_WINDOW_DAYS completed days), one transaction per batch of days"""
+
+    yesterday = date.today() - timedelta(days=1)
+    if start_date is None:
+        start_date = yesterday - timedelta(days=REFRESH_WINDOW_DAYS - 1)
+        end_date = yesterday
+    end_date = end_date or start_date
+
+    try:
+        session.execute(CREATE_TABLE_SQL)
+
+        batch_start = start_date
+        while batch_start <= end_date:
+            batch_end = min(end_date, batch_start + timedelta(days=BATCH_DAYS - 1))
+            result = session.execute(REFRESH_SQL, {"start_date": batch_start, "end_date": batch_end})
+            session.commit()
+            print(f"Refreshed tbl_generation_daily from {batch_start} to {batch_end} ({result.rowcount} rows affected)")
+            batch_start = batch_end + timedelta(days=1)
+
+    except Exception as e:
+        session.rollback()
+        print(f"Error refreshing tbl_generation_daily: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    args = [datetime.strptime(arg, "%Y-%m-%d").date() for arg in sys.argv[1:3]]
+    refresh_generation_daily(*args)